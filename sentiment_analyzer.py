@@ -1,53 +1,219 @@
 import re
 import os
 import string
-from typing import Dict, List, Any, Optional
+import functools
+import threading
+import importlib.util
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
 from loguru import logger
 import nltk
+import numpy as np
 
 # Check for safe mode
 SAFE_MODE = os.environ.get("SAFE_MODE", "false").lower() == "true"
 
-# Set default value for HAVE_TRANSFORMERS
-HAVE_TRANSFORMERS = False
-
-# Try to download NLTK data if not already present
+# Check whether the NLTK VADER lexicon is installed; a missing lexicon is
+# downloaded when the first analyzer is created, not at import
 try:
-    nltk.download('vader_lexicon', quiet=True)
+    nltk.data.find('sentiment/vader_lexicon.zip')
     HAVE_VADER = True
-except:
+except LookupError:
     HAVE_VADER = False
-    logger.warning("NLTK VADER lexicon not available - sentiment analysis will be limited")
 
-# Try importing advanced NLP libraries
+@functools.lru_cache(maxsize=None)
+def _vader_lexicon_available() -> bool:
+    """Return True if the VADER lexicon is installed, downloading it at most once per process"""
+    if HAVE_VADER:
+        return True
+    try:
+        return bool(nltk.download('vader_lexicon', quiet=True))
+    except Exception:
+        return False
+
+# Try importing pyahocorasick for single-pass multi-lexicon scanning
 try:
-    if SAFE_MODE:
-        raise ImportError("Running in safe mode - skipping transformer imports")
-        
-    import torch
-    from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+# Check for advanced NLP libraries. torch and transformers are slow to
+# import, so they are only imported when the models are first used
+if SAFE_MODE:
+    HAVE_TRANSFORMERS = False
+    logger.warning("Advanced NLP libraries not available: Running in safe mode - skipping transformer imports. Using simplified sentiment analysis.")
+elif _module_available("torch") and _module_available("transformers"):
     HAVE_TRANSFORMERS = True
     logger.info("Transformers and PyTorch are available. Using advanced sentiment analysis.")
-except ImportError as e:
+else:
     HAVE_TRANSFORMERS = False
-    logger.warning(f"Advanced NLP libraries not available: {e}. Using simplified sentiment analysis.")
+    logger.warning("Advanced NLP libraries not available: torch or transformers is not installed. Using simplified sentiment analysis.")
+
+# Try importing Numba to compile the byte-level sensationalism scanner
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Check for the ONNX Runtime backend for transformer models
+HAVE_ORT = HAVE_TRANSFORMERS and _module_available("onnxruntime") and _module_available("optimum.onnxruntime")
+
+# Transformer models. The tiny distilled sentiment model is several times
+# faster than the 6-layer DistilBERT one, at a small cost in accuracy
+FAST_SENTIMENT_MODEL = "philschmid/tiny-bert-sst2-distilled"
+ACCURATE_SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+DEFAULT_EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+
+# Texts longer than this are analyzed without caching the result
+MAX_CACHED_TEXT_LENGTH = 10000
+
+# Directory where ONNX exports of the transformer models are cached
+ONNX_CACHE_DIR = os.environ.get("ONNX_CACHE_DIR", os.path.join("models", "onnx"))
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters that regex word boundaries treat as part of a word"""
+    return char.isalnum() or char == '_'
+
+# ASCII bytes that str.split() treats as whitespace
+_WHITESPACE_BYTES = np.array([9, 10, 11, 12, 13, 28, 29, 30, 31, 32], dtype=np.uint8)
+
+def _scan_ascii_bytes(arr: np.ndarray) -> Tuple[int, int, int]:
+    """Walk ASCII bytes once, returning (word count, caps word count, punctuation count)"""
+    words = 0
+    caps = 0
+    punct = 0
+    length = 0
+    uppers = 0
+    lowers = 0
+    for i in range(arr.size + 1):
+        byte = arr[i] if i < arr.size else 32
+        if byte == 32 or (9 <= byte <= 13) or (28 <= byte <= 31):
+            # Whitespace closes the current word, if any
+            if length > 0:
+                words += 1
+                if length > 3 and uppers > 0 and lowers == 0:
+                    caps += 1
+                length = 0
+                uppers = 0
+                lowers = 0
+            continue
+        length += 1
+        if 65 <= byte <= 90:
+            uppers += 1
+        elif 97 <= byte <= 122:
+            lowers += 1
+        elif byte == 33 or byte == 63:
+            punct += 1
+    return words, caps, punct
+
+# Compile the scanner to machine code, caching the result on disk, and warm
+# it up so the first analysis does not pay the compilation cost
+if HAVE_NUMBA:
+    try:
+        _scan_ascii_bytes = njit(cache=True)(_scan_ascii_bytes)
+        _scan_ascii_bytes(np.zeros(1, dtype=np.uint8))
+    except Exception as e:
+        HAVE_NUMBA = False
+        logger.warning(f"Numba compilation failed, using NumPy sensationalism scan: {e}")
+
+def _sensationalism_counts(text: str) -> Tuple[int, int, int]:
+    """
+    Count words, ALL CAPS words longer than 3 characters, and !/? marks in text
+
+    ASCII text is scanned as a byte array, by the Numba-compiled scanner when
+    available and with NumPy otherwise; other text uses str methods.
+
+    Returns:
+        Tuple of (word count, caps word count, punctuation count)
+    """
+    if not text.isascii():
+        words = text.split()
+        caps_count = sum(1 for word in words if len(word) > 3 and word.isupper())
+        return len(words), caps_count, text.count('!') + text.count('?')
+
+    arr = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    if HAVE_NUMBA:
+        return _scan_ascii_bytes(arr)
+
+    punct_count = int(np.count_nonzero((arr == 33) | (arr == 63)))
+
+    in_word = ~np.isin(arr, _WHITESPACE_BYTES)
+    word_starts = in_word.copy()
+    word_starts[1:] &= ~in_word[:-1]
+    starts = np.flatnonzero(word_starts)
+    if starts.size == 0:
+        return 0, 0, punct_count
+
+    # Per-word character, uppercase and lowercase tallies; each segment runs
+    # from one word start to the next, so trailing whitespace adds nothing
+    lengths = np.add.reduceat(in_word.astype(np.int32), starts)
+    uppers = np.add.reduceat(((arr >= 65) & (arr <= 90)).astype(np.int32), starts)
+    lowers = np.add.reduceat(((arr >= 97) & (arr <= 122)).astype(np.int32), starts)
+    caps_count = int(np.count_nonzero((lengths > 3) & (uppers > 0) & (lowers == 0)))
+
+    return int(starts.size), caps_count, punct_count
 
 class SentimentAnalyzer:
     """
     Analyzes sentiment, emotion, and sensationalism in text
     """
+
+    # Loaded pipelines shared by all instances, keyed by model configuration,
+    # so creating another analyzer does not reload the model weights
+    _pipelines = {}
+    _models_lock = threading.Lock()
     
-    def __init__(self):
+    def __init__(self, sentiment_model_id: str = FAST_SENTIMENT_MODEL,
+                 emotion_model_id: str = DEFAULT_EMOTION_MODEL, batch_size: int = 32,
+                 optimize_models: bool = True, use_onnx: bool = False, cache_size: int = 4096,
+                 short_text_threshold: int = 40):
         """
         Initialize sentiment analyzer with available models
+
+        Args:
+            sentiment_model_id: Sentiment model; pass ACCURATE_SENTIMENT_MODEL
+                to trade latency for accuracy
+            emotion_model_id: Emotion detection model
+            batch_size: Number of texts per forward pass in analyze_batch
+            optimize_models: Run transformer models in half precision on GPU
+                or with int8 dynamic quantization on CPU
+            use_onnx: Run transformer models with ONNX Runtime when optimum is installed
+            cache_size: Number of analyze() results kept in the LRU cache
+            short_text_threshold: Texts shorter than this with no positive or
+                negative lexicon hits skip the transformer models
         """
         logger.info("Initializing SentimentAnalyzer")
         
-        self.sentiment_pipeline = None
-        self.emotion_pipeline = None
+        self.sentiment_model_id = sentiment_model_id
+        self.emotion_model_id = emotion_model_id
+        self.batch_size = batch_size
+        self.optimize_models = optimize_models
+        self.use_onnx = use_onnx
+        self.short_text_threshold = short_text_threshold
+        self.device = -1
+
+        # Transformer models are loaded on first use, see _ensure_models
+        self._use_transformers = HAVE_TRANSFORMERS and not SAFE_MODE
+        self._models_loaded = False
+        self._sentiment_pipeline = None
+        self._emotion_pipeline = None
+        self._shared_tokenizer = None
+
+        # Analysis is pure in the text, so results are memoized per instance
+        # Errors propagate through the cache, so fallback results are never cached
+        self._analyze_cached = functools.lru_cache(maxsize=cache_size)(self._compute_results)
         
         # Setup NLTK based VADER sentiment analyzer as fallback
-        if HAVE_VADER:
+        if _vader_lexicon_available():
             try:
                 from nltk.sentiment.vader import SentimentIntensityAnalyzer
                 self.vader = SentimentIntensityAnalyzer()
@@ -55,35 +221,10 @@ class SentimentAnalyzer:
                 logger.error(f"Failed to initialize VADER: {e}")
                 self.vader = None
         else:
+            logger.warning("NLTK VADER lexicon not available - sentiment analysis will be limited")
             self.vader = None
             
-        # Try loading transformers models if available
-        if HAVE_TRANSFORMERS and not SAFE_MODE:
-            try:
-                # Load sentiment analysis model
-                self.sentiment_pipeline = pipeline(
-                    "sentiment-analysis",
-                    model="distilbert-base-uncased-finetuned-sst-2-english",
-                    truncation=True
-                )
-                
-                # Try loading emotion detection model
-                try:
-                    self.emotion_pipeline = pipeline(
-                        "text-classification", 
-                        model="j-hartmann/emotion-english-distilroberta-base", 
-                        top_k=3,
-                        truncation=True
-                    )
-                except Exception as e:
-                    logger.warning(f"Emotion detection model failed to load: {e}")
-                    self.emotion_pipeline = None
-                
-            except Exception as e:
-                logger.warning(f"Error loading transformer models: {e}")
-                self.sentiment_pipeline = None
-                self.emotion_pipeline = None
-        else:
+        if not self._use_transformers:
             logger.warning("Running in safe mode - skipping transformer models")
             
         # Basic lexicons for rule-based fallback
@@ -113,23 +254,361 @@ class SentimentAnalyzer:
             "sadness": ["sad", "unhappy", "depressed", "miserable", "grief"],
             "surprise": ["surprised", "shocked", "amazed", "astonished", "startled"]
         }
-        
+        self._emotion_names = tuple(self.emotion_lexicons)
+
+        lexicons = {
+            "positive": self.positive_words,
+            "negative": self.negative_words,
+            "sensational": self.sensational_words,
+            **self.emotion_lexicons
+        }
+        self._lexicon_sets = {name: frozenset(w.lower() for w in words) for name, words in lexicons.items()}
+
+        # Map each word to the lexicons it belongs to, so a token needs one
+        # dict lookup instead of one membership test per lexicon
+        self._word_lexicons = {}
+        for name, words in self._lexicon_sets.items():
+            for word in words:
+                self._word_lexicons[word] = self._word_lexicons.get(word, ()) + (name,)
+
+        # Fallback scanner: tokenize once, keeping hyphenated words together.
+        # Stdlib re keeps \w Unicode-aware, so accented words stay whole
+        self._token_re = re.compile(r'\w+(?:-\w+)*')
+
+        # Single automaton over all lexicons, so one traversal of the text
+        # counts every lexicon at once
+        self._ac = self._build_automaton(self._word_lexicons) if HAVE_AHOCORASICK else None
+
         logger.info("SentimentAnalyzer initialized successfully")
-        
-    def _count_lexicon_matches(self, text: str, word_list: List[str]) -> int:
-        """Count occurrences of words from a lexicon in text"""
-        text = text.lower()
-        count = 0
-        for word in word_list:
-            # Count whole word matches using regex
-            count += len(re.findall(r'\b' + re.escape(word) + r'\b', text))
-        return count
-        
-    def _rule_based_sentiment(self, text: str) -> Dict[str, Any]:
+
+    @property
+    def sentiment_pipeline(self):
+        """Sentiment pipeline, loaded on first access (None if unavailable)"""
+        self._ensure_models()
+        return self._sentiment_pipeline
+
+    @property
+    def emotion_pipeline(self):
+        """Emotion pipeline, loaded on first access (None if unavailable)"""
+        self._ensure_models()
+        return self._emotion_pipeline
+
+    def _ensure_models(self) -> None:
+        """Import torch/transformers and load the transformer models the first time they are needed"""
+        if self._models_loaded:
+            return
+        with self._models_lock:
+            if self._models_loaded:
+                return
+            if self._use_transformers:
+                self._load_models()
+            self._models_loaded = True
+
+    def _load_models(self) -> None:
+        """Load the sentiment and emotion pipelines"""
+        try:
+            import torch
+
+            # Use the first GPU when one is available
+            self.device = 0 if torch.cuda.is_available() else -1
+            if self.device >= 0 and hasattr(torch.backends.cuda, "enable_flash_sdp"):
+                torch.backends.cuda.enable_flash_sdp(True)
+
+            # Reuse pipelines another instance already loaded
+            key = (self.sentiment_model_id, self.emotion_model_id, self.device,
+                   self.optimize_models, self.use_onnx)
+            if key in SentimentAnalyzer._pipelines:
+                logger.info("Reusing loaded transformer models")
+                self._sentiment_pipeline, self._emotion_pipeline, self._shared_tokenizer = SentimentAnalyzer._pipelines[key]
+                return
+
+            # Load sentiment analysis model
+            self._sentiment_pipeline = self._load_pipeline(
+                "sentiment-analysis",
+                self.sentiment_model_id,
+                truncation=True
+            )
+            
+            # Try loading emotion detection model
+            try:
+                self._emotion_pipeline = self._load_pipeline(
+                    "text-classification", 
+                    self.emotion_model_id, 
+                    top_k=3,
+                    truncation=True
+                )
+            except Exception as e:
+                logger.warning(f"Emotion detection model failed to load: {e}")
+                self._emotion_pipeline = None
+
+            # Tokenize once for both models when they share a vocabulary
+            if self._emotion_pipeline:
+                self._shared_tokenizer = self._find_shared_tokenizer()
+
+            SentimentAnalyzer._pipelines[key] = (
+                self._sentiment_pipeline, self._emotion_pipeline, self._shared_tokenizer
+            )
+            
+        except Exception as e:
+            logger.warning(f"Error loading transformer models: {e}")
+            self._sentiment_pipeline = None
+            self._emotion_pipeline = None
+
+    def _load_pipeline(self, task: str, model_id: str, **kwargs):
+        """Build a pipeline for a model, backed by ONNX Runtime when requested and available"""
+        from transformers import AutoTokenizer, pipeline
+
+        if self.use_onnx and HAVE_ORT:
+            try:
+                model, tokenizer = self._load_onnx_model(model_id)
+                return pipeline(task, model=model, tokenizer=tokenizer, **kwargs)
+            except Exception as e:
+                logger.warning(f"ONNX Runtime model for {model_id} failed to load, using PyTorch: {e}")
+        elif self.use_onnx:
+            logger.warning("optimum[onnxruntime] not available - using PyTorch models")
+
+        # Pin the Rust-backed fast tokenizer rather than relying on the pipeline default
+        tokenizer = AutoTokenizer.from_pretrained(model_id, use_fast=True)
+        if not tokenizer.is_fast:
+            logger.warning(f"No fast tokenizer available for {model_id}")
+
+        pipe = pipeline(task, model=model_id, tokenizer=tokenizer, device=self.device, **kwargs)
+        if self.optimize_models:
+            self._optimize_pipeline(pipe)
+        return pipe
+
+    def _load_onnx_model(self, model_id: str):
+        """Load the ONNX export of a model, exporting it to the cache directory on first use"""
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+
+        export_dir = os.path.join(ONNX_CACHE_DIR, model_id.replace("/", "--"))
+        provider = "CUDAExecutionProvider" if self.device >= 0 else "CPUExecutionProvider"
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        if os.path.isdir(export_dir):
+            model = ORTModelForSequenceClassification.from_pretrained(
+                export_dir, provider=provider, session_options=session_options
+            )
+            tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        else:
+            logger.info(f"Exporting {model_id} to ONNX in {export_dir}")
+            model = ORTModelForSequenceClassification.from_pretrained(
+                model_id, export=True, provider=provider, session_options=session_options
+            )
+            tokenizer = AutoTokenizer.from_pretrained(model_id)
+            model.save_pretrained(export_dir)
+            tokenizer.save_pretrained(export_dir)
+
+        return model, tokenizer
+
+    def _find_shared_tokenizer(self):
+        """Return the sentiment tokenizer if the emotion model uses the same vocabulary, else None"""
+        sentiment_tokenizer = self._sentiment_pipeline.tokenizer
+        emotion_tokenizer = self._emotion_pipeline.tokenizer
+        if (type(sentiment_tokenizer) is type(emotion_tokenizer)
+                and sentiment_tokenizer.get_vocab() == emotion_tokenizer.get_vocab()):
+            logger.info("Sentiment and emotion models share a tokenizer")
+            return sentiment_tokenizer
+        return None
+
+    def _run_shared_models(self, text: str):
+        """
+        Tokenize text once and run both the sentiment and emotion models on the same ids
+
+        Returns:
+            Tuple of (sentiment_result, emotion_result) shaped like the pipeline outputs
+        """
+        import torch
+
+        encoding = self._shared_tokenizer(text, truncation=True, max_length=512, return_tensors="pt")
+
+        with torch.inference_mode():
+            sentiment_model = self.sentiment_pipeline.model
+            logits = sentiment_model(**encoding.to(self.sentiment_pipeline.device)).logits
+            sentiment_probs = logits.float().softmax(-1)[0]
+
+            emotion_model = self.emotion_pipeline.model
+            logits = emotion_model(**encoding.to(self.emotion_pipeline.device)).logits
+            emotion_probs = logits.float().softmax(-1)[0]
+
+        label_id = int(sentiment_probs.argmax())
+        sentiment_result = {
+            "label": sentiment_model.config.id2label[label_id],
+            "score": float(sentiment_probs[label_id])
+        }
+
+        return sentiment_result, self._top_emotions(emotion_model, emotion_probs)
+
+    def _run_models_batch(self, texts: List[str]) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+        """
+        Tokenize texts a batch at a time and feed the ids straight to the models
+
+        Returns:
+            Tuple of (sentiment_results, emotion_results) shaped like the pipeline outputs;
+            a list is empty when its model is not loaded
+        """
+        import torch
+
+        sentiment_pipeline = self.sentiment_pipeline
+        emotion_pipeline = self.emotion_pipeline
+        sentiment_results = []
+        emotion_results = []
+
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            encoding = None
+            with torch.inference_mode():
+                if sentiment_pipeline:
+                    encoding = sentiment_pipeline.tokenizer(
+                        batch, padding=True, truncation=True, max_length=512, return_tensors="pt"
+                    )
+                    logits = sentiment_pipeline.model(**encoding.to(sentiment_pipeline.device)).logits
+                    scores, label_ids = logits.float().softmax(-1).max(-1)
+                    id2label = sentiment_pipeline.model.config.id2label
+                    sentiment_results.extend(
+                        {"label": id2label[i], "score": score}
+                        for score, i in zip(scores.tolist(), label_ids.tolist())
+                    )
+
+                if emotion_pipeline:
+                    if encoding is None or self._shared_tokenizer is None:
+                        encoding = emotion_pipeline.tokenizer(
+                            batch, padding=True, truncation=True, max_length=512, return_tensors="pt"
+                        )
+                    logits = emotion_pipeline.model(**encoding.to(emotion_pipeline.device)).logits
+                    probs = logits.float().softmax(-1)
+                    emotion_results.extend(self._top_emotions(emotion_pipeline.model, row) for row in probs)
+
+        return sentiment_results, emotion_results
+
+    def _run_emotion_model(self, text: str) -> List[Dict[str, Any]]:
+        """Run the emotion model directly, skipping the pipeline's per-call pre- and postprocessing"""
+        import torch
+
+        pipe = self.emotion_pipeline
+        encoding = pipe.tokenizer(text, truncation=True, max_length=512, return_tensors="pt")
+        with torch.inference_mode():
+            logits = pipe.model(**encoding.to(pipe.device)).logits
+        return self._top_emotions(pipe.model, logits.float().softmax(-1)[0])
+
+    @staticmethod
+    def _top_emotions(model, probs) -> List[Dict[str, Any]]:
+        """Top 3 emotions from a probability vector, shaped like the pipeline output"""
+        scores, label_ids = probs.topk(min(3, probs.numel()))
+        id2label = model.config.id2label
+        return [
+            {"label": id2label[i], "score": score}
+            for score, i in zip(scores.tolist(), label_ids.tolist())
+        ]
+
+    def _optimize_pipeline(self, pipe) -> None:
+        """Use fused, compiled kernels in half precision on GPU, or quantize the model to int8 on CPU"""
+        import torch
+
+        try:
+            if self.device >= 0:
+                pipe.model = self._to_bettertransformer(pipe.model)
+                if torch.cuda.is_bf16_supported():
+                    pipe.model = pipe.model.to(torch.bfloat16)
+                else:
+                    pipe.model = pipe.model.half()
+                self._compile_pipeline(pipe)
+            else:
+                pipe.model = torch.ao.quantization.quantize_dynamic(
+                    pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+        except Exception as e:
+            logger.warning(f"Model optimization failed, keeping fp32 weights: {e}")
+
+    @staticmethod
+    def _compile_pipeline(pipe) -> None:
+        """Compile the model with torch.compile on PyTorch 2.1+ and warm it up so the first request does not pay for compilation"""
+        import torch
+
+        torch_version = tuple(int(part) for part in re.findall(r"\d+", torch.__version__)[:2])
+        if torch_version < (2, 1):
+            return
+
+        model = pipe.model
+        try:
+            pipe.model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            pipe("hello world")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using the eager model: {e}")
+            pipe.model = model
+
+    @staticmethod
+    def _to_bettertransformer(model):
+        """Swap in BetterTransformer fused attention layers, returning the model unchanged if unsupported"""
+        try:
+            from optimum.bettertransformer import BetterTransformer
+            return BetterTransformer.transform(model, keep_original_model=False)
+        except Exception as e:
+            logger.debug(f"BetterTransformer not applied: {e}")
+            return model
+
+    @staticmethod
+    def _build_automaton(word_lexicons: Dict[str, Tuple[str, ...]]):
+        """Build an Aho-Corasick automaton tagging each word with the lexicons it belongs to"""
+        automaton = ahocorasick.Automaton()
+        for word, names in word_lexicons.items():
+            automaton.add_word(word, (len(word), names))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan_all(self, text_lc: str) -> Counter:
+        """Count whole-word matches for every lexicon in lowercased text, keyed by lexicon name"""
+        counts = Counter()
+        if self._ac is None:
+            word_lexicons = self._word_lexicons
+            for token in self._token_re.findall(text_lc):
+                if '-' not in token:
+                    names = word_lexicons.get(token)
+                    if names:
+                        counts.update(names)
+                    continue
+                # Hyphens are word boundaries too, so count each part and
+                # each hyphenated pair ("game-changing") separately
+                parts = token.split('-')
+                for i, part in enumerate(parts):
+                    names = word_lexicons.get(part)
+                    if names:
+                        counts.update(names)
+                    if i:
+                        names = word_lexicons.get(parts[i - 1] + '-' + part)
+                        if names:
+                            counts.update(names)
+            return counts
+
+        last = len(text_lc) - 1
+        for end, (length, names) in self._ac.iter(text_lc):
+            start = end - length + 1
+            # Enforce word boundaries on both sides of the match
+            if start > 0 and _is_word_char(text_lc[start - 1]):
+                continue
+            if end < last and _is_word_char(text_lc[end + 1]):
+                continue
+            counts.update(names)
+        return counts
+
+    def _is_trivial(self, text: str, counts: Optional[Counter] = None) -> bool:
+        """Check if text is short and has no sentiment words, so a model call is not worth it"""
+        if len(text) >= self.short_text_threshold:
+            return False
+        if counts is None:
+            counts = self._scan_all(text.lower())
+        return counts["positive"] + counts["negative"] == 0
+
+    def _rule_based_sentiment(self, text: str, counts: Optional[Counter] = None,
+                              total_words: Optional[int] = None) -> Dict[str, Any]:
         """Simple rule-based sentiment analysis"""
-        text = text.lower()
-        positive_count = self._count_lexicon_matches(text, self.positive_words)
-        negative_count = self._count_lexicon_matches(text, self.negative_words)
+        if counts is None:
+            counts = self._scan_all(text.lower())
+        positive_count = counts["positive"]
+        negative_count = counts["negative"]
         
         # Determine sentiment based on counts
         if positive_count > negative_count * 1.5:
@@ -140,7 +619,8 @@ class SentimentAnalyzer:
             sentiment = "NEUTRAL"
             
         # Calculate confidence (simplified)
-        total_words = len(text.split())
+        if total_words is None:
+            total_words = len(text.split())
         if total_words > 0:
             confidence = min(0.7, max(0.3, (positive_count + negative_count) / total_words))
         else:
@@ -153,55 +633,55 @@ class SentimentAnalyzer:
             "negative_score": negative_count
         }
     
-    def _rule_based_emotion(self, text: str) -> Dict[str, Any]:
+    def _rule_based_emotion(self, text: str, counts: Optional[Counter] = None) -> Dict[str, Any]:
         """Simple rule-based emotion detection"""
-        text = text.lower()
-        emotions = {}
-        
-        for emotion, words in self.emotion_lexicons.items():
-            count = self._count_lexicon_matches(text, words)
-            emotions[emotion] = count
+        if counts is None:
+            counts = self._scan_all(text.lower())
+        emotions = {emotion: counts[emotion] for emotion in self._emotion_names}
             
-        # Find top emotion
-        top_emotion = max(emotions.items(), key=lambda x: x[1])
+        # Find top emotion (first one wins ties)
+        top_emotion = max(self._emotion_names, key=emotions.__getitem__)
         
         # If no emotions detected, return none
-        if top_emotion[1] == 0:
+        if emotions[top_emotion] == 0:
             return {
                 "top_emotion": "none",
                 "emotions": emotions
             }
         
         return {
-            "top_emotion": top_emotion[0],
+            "top_emotion": top_emotion,
             "emotions": emotions
         }
     
-    def _analyze_sensationalism(self, text: str) -> float:
+    def _analyze_sensationalism(self, text: str, counts: Optional[Counter] = None,
+                                features: Optional[Tuple[int, int, int]] = None) -> float:
         """Analyze sensationalism in text"""
         # Count sensational words
-        count = self._count_lexicon_matches(text, self.sensational_words)
+        if counts is None:
+            counts = self._scan_all(text.lower())
+        count = counts["sensational"]
         
+        # Count words, ALL CAPS words and !/? marks together
+        if features is None:
+            features = _sensationalism_counts(text)
+        total_words, caps_count, punct_count = features
+
         # Calculate score (normalized by text length)
-        total_words = len(text.split())
         if total_words > 0:
             score = min(1.0, count / (total_words / 10))  # Scale by 1 per 10 words
         else:
             score = 0.0
             
         # Add score for ALL CAPS words
-        words = text.split()
-        caps_count = sum(1 for word in words if len(word) > 3 and word.isupper())
         if total_words > 0:
             caps_score = min(1.0, caps_count / (total_words / 5))
         else:
             caps_score = 0.0
             
         # Check for excessive punctuation
-        exclamation_count = text.count('!')
-        question_count = text.count('?')
         if total_words > 0:
-            punct_score = min(1.0, (exclamation_count + question_count) / (total_words / 5))
+            punct_score = min(1.0, punct_count / (total_words / 5))
         else:
             punct_score = 0.0
             
@@ -222,58 +702,184 @@ class SentimentAnalyzer:
         """
         logger.info("Analyzing sentiment and emotion")
         
-        # Initialize results
-        results = {
+        if text and len(text) > MAX_CACHED_TEXT_LENGTH:
+            results = self._analyze_text(text)
+        else:
+            try:
+                # Copy so callers cannot modify the cached result
+                cached = self._analyze_cached(text)
+                results = {**cached, "emotions": dict(cached["emotions"])}
+            except Exception as e:
+                results = self._fallback_results(text, e)
+            
+        logger.info(f"Analysis complete: sentiment={results['sentiment']}, top_emotion={results['top_emotion']}, sensationalism_score={results['sensationalism_score']:.2f}")
+        return results
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment, emotion and sensationalism for several texts at once
+
+        Texts are tokenized and run through the transformer models a batch at a time.
+        Texts without a batched result are analyzed individually.
+        
+        Args:
+            texts: Input texts to analyze
+            
+        Returns:
+            List of analysis results, in the same order as texts
+        """
+        logger.info(f"Analyzing sentiment and emotion for {len(texts)} texts")
+
+        # Only texts long enough to analyze and not trivially neutral are sent to the models
+        indices = [i for i, text in enumerate(texts)
+                   if text and len(text) >= 3 and not self._is_trivial(text)]
+        # Sort by length so each batch holds texts of similar size and
+        # wastes little work on padding; results are mapped back by index
+        indices.sort(key=lambda i: len(texts[i]))
+        truncated = [texts[i][:512] for i in indices]
+
+        sentiment_results = {}
+        emotion_results = {}
+        if truncated and self.sentiment_pipeline:
+            try:
+                sentiment_outputs, emotion_outputs = self._run_models_batch(truncated)
+                sentiment_results = dict(zip(indices, sentiment_outputs))
+                emotion_results = dict(zip(indices, emotion_outputs))
+            except Exception as e:
+                logger.error(f"Error in batched sentiment analysis, analyzing texts individually: {str(e)}")
+
+        results = [
+            self._analyze_text(text, sentiment_results.get(i), emotion_results.get(i))
+            for i, text in enumerate(texts)
+        ]
+
+        logger.info(f"Batch analysis complete for {len(results)} texts")
+        return results
+
+    def _analyze_text(self, text: str, sentiment_result: Optional[Dict[str, Any]] = None,
+                      emotion_result: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Analyze a single text, reusing pipeline outputs already computed for it
+
+        Args:
+            text: Input text to analyze
+            sentiment_result: Sentiment pipeline output for text, if already computed
+            emotion_result: Emotion pipeline output for text, if already computed
+
+        Returns:
+            Dictionary with analysis results
+        """
+        try:
+            return self._compute_results(text, sentiment_result, emotion_result)
+        except Exception as e:
+            return self._fallback_results(text, e)
+
+    @staticmethod
+    def _empty_results() -> Dict[str, Any]:
+        """Return the neutral result used before any analysis has run"""
+        return {
             "sentiment": "NEUTRAL",
             "confidence": 0.0,
             "top_emotion": "none",
             "emotions": {},
             "sensationalism_score": 0.0
         }
+
+    def _fallback_results(self, text: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build a rule-based result for a text whose analysis raised an error
+
+        Args:
+            text: Input text that failed to analyze
+            error: Exception raised during analysis
+
+        Returns:
+            Dictionary with analysis results
+        """
+        logger.error(f"Error in sentiment analysis: {str(error)}")
+        # If error occurs, use simple rule-based as final fallback
+        results = self._empty_results()
+        results.update(self._rule_based_sentiment(text))
+        return results
+
+    def _compute_results(self, text: str, sentiment_result: Optional[Dict[str, Any]] = None,
+                         emotion_result: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Analyze a single text, raising any error from the models or scanners
+
+        Args:
+            text: Input text to analyze
+            sentiment_result: Sentiment pipeline output for text, if already computed
+            emotion_result: Emotion pipeline output for text, if already computed
+
+        Returns:
+            Dictionary with analysis results
+        """
+        # Initialize results
+        results = self._empty_results()
         
         if not text or len(text) < 3:
             return results
             
-        # Use appropriate analysis method based on availability
-        try:
-            # First try transformer-based sentiment analysis
-            if self.sentiment_pipeline:
-                pipeline_result = self.sentiment_pipeline(text[:512])
-                results["sentiment"] = pipeline_result[0]["label"].upper()
-                results["confidence"] = round(pipeline_result[0]["score"], 2)
-            # Then try VADER
-            elif self.vader:
-                scores = self.vader.polarity_scores(text)
-                if scores["compound"] >= 0.05:
-                    results["sentiment"] = "POSITIVE"
-                elif scores["compound"] <= -0.05:
-                    results["sentiment"] = "NEGATIVE"
-                else:
-                    results["sentiment"] = "NEUTRAL"
-                results["confidence"] = round(abs(scores["compound"]), 2)
-            # Fallback to rule-based
-            else:
-                rule_results = self._rule_based_sentiment(text)
-                results.update(rule_results)
-                
-            # Emotion analysis
-            if self.emotion_pipeline:
-                emotion_result = self.emotion_pipeline(text[:512])
-                if emotion_result[0]:
-                    results["top_emotion"] = emotion_result[0][0]["label"]
-                    results["emotions"] = {item["label"]: round(item["score"], 2) for item in emotion_result[0]}
+        # Lowercase, scan all lexicons and count words once for the
+        # rule-based parts of the analysis
+        counts = self._scan_all(text.lower())
+        features = _sensationalism_counts(text)
+        # Short texts without sentiment words skip the transformer models
+        trivial = self._is_trivial(text, counts)
+
+        # Run both models on one tokenization when they share a vocabulary
+        # (accessing sentiment_pipeline loads the models if needed)
+        if (sentiment_result is None and emotion_result is None
+                and not trivial and self.sentiment_pipeline and self._shared_tokenizer):
+            sentiment_result, emotion_result = self._run_shared_models(text[:512])
+
+        # First try transformer-based sentiment analysis
+        if sentiment_result is None and not trivial and self.sentiment_pipeline:
+            sentiment_result = self.sentiment_pipeline(text[:512])[0]
+        if sentiment_result is not None:
+            results["sentiment"] = sentiment_result["label"].upper()
+            results["confidence"] = round(sentiment_result["score"], 2)
+        # Then try VADER
+        elif self.vader:
+            scores = self.vader.polarity_scores(text)
+            if scores["compound"] >= 0.05:
+                results["sentiment"] = "POSITIVE"
+            elif scores["compound"] <= -0.05:
+                results["sentiment"] = "NEGATIVE"
             else:
-                emotion_results = self._rule_based_emotion(text)
-                results.update(emotion_results)
-                
-            # Sensationalism analysis (rule-based for all modes)
-            results["sensationalism_score"] = self._analyze_sensationalism(text)
-            
-        except Exception as e:
-            logger.error(f"Error in sentiment analysis: {str(e)}")
-            # If error occurs, use simple rule-based as final fallback
-            rule_results = self._rule_based_sentiment(text)
+                results["sentiment"] = "NEUTRAL"
+            results["confidence"] = round(abs(scores["compound"]), 2)
+        # Fallback to rule-based
+        else:
+            rule_results = self._rule_based_sentiment(text, counts, features[0])
             results.update(rule_results)
             
-        logger.info(f"Analysis complete: sentiment={results['sentiment']}, top_emotion={results['top_emotion']}, sensationalism_score={results['sensationalism_score']:.2f}")
-        return results 
\ No newline at end of file
+        # Emotion analysis
+        if emotion_result is None and not trivial and self.emotion_pipeline:
+            emotion_result = self._run_emotion_model(text[:512])
+        if emotion_result is not None:
+            if emotion_result:
+                results["top_emotion"] = emotion_result[0]["label"]
+                results["emotions"] = {item["label"]: round(item["score"], 2) for item in emotion_result}
+        else:
+            emotion_results = self._rule_based_emotion(text, counts)
+            results.update(emotion_results)
+            
+        # Sensationalism analysis (rule-based for all modes)
+        results["sensationalism_score"] = self._analyze_sensationalism(text, counts, features)
+        
+        return results
+
+@functools.lru_cache(maxsize=4)
+def get_analyzer(**kwargs) -> SentimentAnalyzer:
+    """
+    Get a shared SentimentAnalyzer
+
+    Args:
+        **kwargs: SentimentAnalyzer constructor arguments
+
+    Returns:
+        The same analyzer instance for the same arguments
+    """
+    return SentimentAnalyzer(**kwargs)
\ No newline at end of file
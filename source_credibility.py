@@ -1,14 +1,169 @@
+import os
 import re
 import time
 import json
+import bisect
+import functools
+import itertools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from datetime import datetime
 from loguru import logger
+import numpy as np
 import tldextract
 from bs4 import BeautifulSoup
 
+# Try importing orjson for faster database loading
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Try importing pandas for vectorized bulk scoring
+try:
+    import pandas as pd
+    HAVE_PANDAS = True
+except ImportError:
+    HAVE_PANDAS = False
+
+# Try importing RE2 for linear-time domain pattern matching
+try:
+    import re2
+    HAVE_RE2 = True
+except ImportError:
+    HAVE_RE2 = False
+
+# Try importing pyahocorasick for single-pass keyword scanning
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    HAVE_AHOCORASICK = False
+
+# Prefer the C-backed lxml parser over the pure-Python html.parser
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+def _now() -> str:
+    """Current local time as an ISO 8601 timestamp"""
+    return datetime.now().isoformat()
+
+# Positions of the credibility features combined by _combine_score
+(F_KEYWORD, F_TLD, F_FAKE_PATTERN, F_SUBDOMAIN_KEYWORD, F_EXPLICIT_FAKE,
+ F_NO_ABOUT, F_NO_CONTACT, F_MANY_ADS, F_SENSATIONAL, F_FETCH_FAILED) = range(10)
+NUM_FEATURES = 10
+
+def _combine_score(features: Sequence[float]) -> float:
+    """
+    Combine extracted domain and page features into a credibility score
+    
+    Args:
+        features: NUM_FEATURES values indexed by the F_* constants;
+            F_SENSATIONAL holds a headline count, the rest are 0/1 flags
+            
+    Returns:
+        Score clamped to 0.1-0.7, the range allowed for unknown sources
+    """
+    score = 0.5
+    if features[F_KEYWORD]:
+        score -= 0.1
+    if features[F_TLD]:
+        score -= 0.1
+    if features[F_FAKE_PATTERN]:
+        score -= 0.2
+    if features[F_SUBDOMAIN_KEYWORD]:
+        score -= 0.05
+    if features[F_EXPLICIT_FAKE]:
+        score = 0.1
+    if features[F_NO_ABOUT]:
+        score -= 0.05
+    if features[F_NO_CONTACT]:
+        score -= 0.05
+    if features[F_MANY_ADS]:
+        score -= 0.1
+    if features[F_SENSATIONAL] > 2:
+        score -= 0.15
+    if features[F_FETCH_FAILED]:
+        score -= 0.05
+    return max(0.1, min(0.7, score))
+
+# Credibility database asset: {domain: {"score", "category", "bias"}}
+CREDIBILITY_DB_PATH = os.environ.get(
+    "CREDIBILITY_DB_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "credibility_db.json")
+)
+
+# Domain keywords that mark a source as obviously fake
+EXPLICIT_FAKE_KEYWORDS = ('fake', 'hoax')
+
+# Maximum number of analyzed domains and scored URLs kept in memory
+DOMAIN_CACHE_SIZE = 2048
+SCORE_CACHE_SIZE = 4096
+
+# Patterns used when inspecting fetched pages
+_ABOUT_RE = re.compile(r'about', re.I)
+_CONTACT_RE = re.compile(r'contact', re.I)
+# Ad class names as whole tokens, so "shadow", "badge" or "radar" don't count
+_AD_CLASS_RE = re.compile(r'(?:^|[\s_-])(?:ad|ads|advert|adverts|advertisement|adsense|ad-container|ad-slot)(?:$|[\s_-])', re.I)
+SENSATIONAL_PHRASES = ('shocking', 'you won\'t believe', 'incredible',
+                       'mind-blowing', 'secret', 'they don\'t want you to know')
+_SENSATIONAL_RE = re.compile('|'.join(map(re.escape, SENSATIONAL_PHRASES)), re.I)
+_HEADLINE_TAGS = frozenset(('h1', 'h2', 'h3'))
+
+if HAVE_AHOCORASICK:
+    _SENSATIONAL_AC = ahocorasick.Automaton()
+    for _phrase in SENSATIONAL_PHRASES:
+        _SENSATIONAL_AC.add_word(_phrase, _phrase)
+    _SENSATIONAL_AC.make_automaton()
+else:
+    _SENSATIONAL_AC = None
+
+def _count_sensational(headlines: List[str]) -> int:
+    """Count headlines containing at least one sensational phrase"""
+    if _SENSATIONAL_AC is None:
+        return sum(1 for headline in headlines if _SENSATIONAL_RE.search(headline))
+    
+    # Scan all headlines at once, then map each hit back to its headline
+    # through the offsets where each headline (plus separator) ends
+    lowered = [headline.lower() for headline in headlines]
+    ends = list(itertools.accumulate(len(headline) + 1 for headline in lowered))
+    hits = {bisect.bisect_right(ends, end) for end, _ in _SENSATIONAL_AC.iter('\n'.join(lowered))}
+    return len(hits)
+
+def _scan_dom(soup: BeautifulSoup) -> Tuple[int, int, int, int, int]:
+    """
+    Count credibility signals on a parsed page in a single walk over its tags
+    
+    Returns:
+        Tuple of (about links, contact links, iframes, ad divs, sensational headlines)
+    """
+    about = contact = iframes = ads = 0
+    headlines = []
+    for tag in soup.find_all(True):
+        name = tag.name
+        if name == 'a':
+            text = tag.string
+            if text is not None:
+                if _ABOUT_RE.search(text):
+                    about += 1
+                if _CONTACT_RE.search(text):
+                    contact += 1
+        elif name == 'iframe':
+            iframes += 1
+        elif name == 'div':
+            classes = tag.get('class')
+            if classes and _AD_CLASS_RE.search(' '.join(classes)):
+                ads += 1
+        elif name in _HEADLINE_TAGS:
+            headlines.append(tag.get_text())
+    return about, contact, iframes, ads, _count_sensational(headlines)
+
 class SourceCredibilityAnalyzer:
     """
     Analyzes the credibility of news sources
@@ -21,8 +176,20 @@ class SourceCredibilityAnalyzer:
         # Load credibility database
         self.credibility_db = self._load_credibility_database()
         
-        # Domain metadata cache
-        self.domain_cache = {}
+        # Public Suffix List based domain splitter, using the snapshot bundled
+        # with tldextract so it never fetches the list over the network. It is
+        # shared by every method and memoized, so each host is parsed once.
+        self._extract = functools.lru_cache(maxsize=DOMAIN_CACHE_SIZE)(
+            tldextract.TLDExtract(suffix_list_urls=())
+        )
+        
+        # Domain metadata cache, least recently used entries evicted first
+        self.domain_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Scores are memoized per URL so repeated articles skip the checks and fetch;
+        # guarded by _cache_lock like the domain cache
+        self.score_cache = OrderedDict()
         
         # Request headers
         self.headers = {
@@ -31,9 +198,21 @@ class SourceCredibilityAnalyzer:
             'Accept-Language': 'en-US,en;q=0.5'
         }
         
-        # Rate limiting
+        # Shared session so fetches reuse pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.headers)
+        
+        # Rate limiting, per host so unrelated sites don't wait on each other
         self.min_request_interval = 2  # seconds
-        self.last_request_time = 0
+        self.last_request_times = {}  # host -> time.monotonic() of the last request
+        self._rate_limit_lock = threading.Lock()
         
         # Known fake news domains (simplified list for demo)
         self.fake_news_domains = [
@@ -129,65 +308,210 @@ class SourceCredibilityAnalyzer:
         ]
         
         # Create specific detection patterns for common hoaxes
+        # (gaps between terms are bounded to keep backtracking linear)
         self.hoax_patterns = {
             "astronomical_disasters": [
-                r'\b(planet[ary]?\s+alignment)\b.*\b(disaster|catastrophe|blackout)\b',
-                r'\b(venus|mars|jupiter|saturn)\b.*\b(align\w*)\b.*\b(disaster|catastrophe|blackout)\b',
-                r'\b(celestial\s+event)\b.*\b(power\s+outage|blackout)\b',
-                r'\b(nasa|scientists)\b.*\b(covering\s+up|hiding|conceal)\b.*\b(planet|asteroid|meteor)\b'
+                r'\b(planet[ary]?\s+alignment)\b.{0,200}?\b(disaster|catastrophe|blackout)\b',
+                r'\b(venus|mars|jupiter|saturn)\b.{0,200}?\b(align\w*)\b.{0,200}?\b(disaster|catastrophe|blackout)\b',
+                r'\b(celestial\s+event)\b.{0,200}?\b(power\s+outage|blackout)\b',
+                r'\b(nasa|scientists)\b.{0,200}?\b(covering\s+up|hiding|conceal)\b.{0,200}?\b(planet|asteroid|meteor)\b'
             ],
             "health_conspiracies": [
-                r'\b(vaccine|vaccination)\b.*\b(autism|mind\s+control|track|chip|5g)\b',
-                r'\b(cure\s+for\s+cancer|cure\s+for\s+all\s+disease)\b.*\b(suppressed|hidden|secret)\b',
+                r'\b(vaccine|vaccination)\b.{0,200}?\b(autism|mind\s+control|track|chip|5g)\b',
+                r'\b(cure\s+for\s+cancer|cure\s+for\s+all\s+disease)\b.{0,200}?\b(suppressed|hidden|secret)\b',
                 r'\b(miracle\s+cure|miracle\s+mineral\s+solution|mms)\b'
             ],
             "political_conspiracies": [
                 r'\b(deep\s+state|cabal|illuminati|new\s+world\s+order|nwo)\b',
-                r'\b(government|cia|fbi)\b.*\b(controlling|control|manipulate)\b.*\b(weather|minds|population)\b',
-                r'\b(microchip|rfid)\b.*\b(implant|track|control)\b.*\b(human|people|citizen)\b'
+                r'\b(government|cia|fbi)\b.{0,200}?\b(controlling|control|manipulate)\b.{0,200}?\b(weather|minds|population)\b',
+                r'\b(microchip|rfid)\b.{0,200}?\b(implant|track|control)\b.{0,200}?\b(human|people|citizen)\b'
             ]
         }
         
+        # All known domains in one trie keyed by reversed labels, so a host and
+        # each of its parent domains are looked up in a single walk
+        self._domain_trie = self._build_domain_trie({
+            "credibility_db": self.credibility_db,
+            "credible_sources": self.credible_sources,
+            "non_credible_sources": self.non_credible_sources,
+            "credible_domains": dict.fromkeys(self.credible_domains, True),
+            "fake_news_domains": dict.fromkeys((d for d in self.fake_news_domains if '.' in d), True)
+        })
+        
+        # Scores of known sources by base domain, for bulk scoring. Domains
+        # with more specific entries below them are left to the trie.
+        self._score_table = {
+            domain: score
+            for domain, score in {**self.non_credible_sources, **self.credible_sources}.items()
+            if not self._has_subdomain_entries(domain)
+        }
+        
+        # Minimal list of fragments still needed for substring matches (an
+        # entry containing another entry can never match on its own)
+        self._fake_substrings = self._minimal_fragments(self.fake_news_domains)
+        self._credible_substrings = self._minimal_fragments(self.credible_domains)
+        
+        # One automaton over all suspicious and explicit fake keywords so a
+        # domain is scanned once, and the TLDs as a tuple for a single endswith call
+        self._keyword_ac = self._build_keyword_automaton(self.suspicious_keywords) if HAVE_AHOCORASICK else None
+        self._suspicious_tld_tuple = tuple(tld.lower() for tld in self.suspicious_tlds)
+        
+        # Domain type and score by TLD for get_domain_type, with the known
+        # organizations under a TLD that get a more specific type
+        mainstream_news = (frozenset(('cnn', 'bbc', 'nytimes', 'washingtonpost', 'reuters', 'ap')),
+                           ("mainstream_news", 0.85))
+        self._notable_domains_by_tld = {
+            '.org': (frozenset(('snopes', 'factcheck', 'politifact')), ("fact_checker", 0.9)),
+            '.com': mainstream_news,
+            '.net': mainstream_news
+        }
+        self._domain_type_by_tld = {
+            **{tld: ("suspicious", 0.3) for tld in self.suspicious_tlds},
+            '.gov': ("official", 0.9),
+            '.edu': ("official", 0.9),
+            '.mil': ("official", 0.9),
+            '.org': ("organization", 0.7),
+            '.com': ("commercial", 0.5),
+            '.net': ("commercial", 0.5)
+        }
+        
+        # Compile patterns once rather than on every check
+        # Fake-domain patterns are matched as one alternation, with a named
+        # group per pattern to report which one matched
+        self._fake_domain_union = self._compile_pattern(
+            '|'.join(f'(?P<p{i}>{p})' for i, p in enumerate(self.fake_domain_patterns))
+        )
+        self._hoax_patterns_compiled = {
+            category: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for category, patterns in self.hoax_patterns.items()
+        }
+        # One alternation per category, with a named group per pattern, so
+        # text without hoax terms is scanned once per category
+        self._hoax_union = {
+            category: re.compile('|'.join(f'(?P<g{i}>{p})' for i, p in enumerate(patterns)), re.IGNORECASE)
+            for category, patterns in self.hoax_patterns.items()
+        }
+        
         logger.info("SourceCredibilityAnalyzer initialized successfully")
     
-    def _load_credibility_database(self) -> Dict[str, Dict[str, Any]]:
+    @staticmethod
+    def _build_domain_trie(sources: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Load the credibility database
+        Build a trie of domain labels in reverse order (bbc.co.uk -> uk, co, bbc)
         
-        In a real implementation, this would load from a file or external API
+        Args:
+            sources: Mapping of source name to {domain: entry}
+            
+        Returns:
+            Nested dicts keyed by label; a node's '__data__' maps source name to entry
+        """
+        trie = {}
+        for source, entries in sources.items():
+            for domain, entry in entries.items():
+                node = trie
+                for label in reversed(domain.lower().split('.')):
+                    node = node.setdefault(label, {})
+                node.setdefault('__data__', {})[source] = entry
+        return trie
+    
+    def _lookup_domain(self, domain: str) -> Dict[str, Any]:
+        """
+        Find known entries for a domain or any of its parent domains
         
+        Args:
+            domain: Domain to look up (e.g. news.bbc.co.uk)
+            
         Returns:
-            Dictionary with domain credibility information
+            Mapping of source name to entry, taken from the closest matching domain per source
         """
-        # This is a simplified mock database for demonstration purposes
-        # In a real system, this would be a comprehensive database of news sources
-        
-        db = {
-            # Major reputable news sources
-            "bbc.com": {"score": 0.95, "category": "RELIABLE", "bias": "SLIGHT_LEFT"},
-            "reuters.com": {"score": 0.97, "category": "RELIABLE", "bias": "CENTER"},
-            "apnews.com": {"score": 0.96, "category": "RELIABLE", "bias": "CENTER"},
-            "npr.org": {"score": 0.92, "category": "RELIABLE", "bias": "SLIGHT_LEFT"},
-            "economist.com": {"score": 0.93, "category": "RELIABLE", "bias": "CENTER"},
-            "wsj.com": {"score": 0.92, "category": "RELIABLE", "bias": "SLIGHT_RIGHT"},
-            "nytimes.com": {"score": 0.90, "category": "MOSTLY_RELIABLE", "bias": "LEFT"},
-            "washingtonpost.com": {"score": 0.89, "category": "MOSTLY_RELIABLE", "bias": "LEFT"},
-            "theguardian.com": {"score": 0.88, "category": "MOSTLY_RELIABLE", "bias": "LEFT"},
-            "cnn.com": {"score": 0.80, "category": "MIXED", "bias": "LEFT"},
-            "foxnews.com": {"score": 0.70, "category": "MIXED", "bias": "RIGHT"},
-            
-            # Known misinformation sources
-            "infowars.com": {"score": 0.05, "category": "UNRELIABLE", "bias": "EXTREME_RIGHT"},
-            "naturalnews.com": {"score": 0.10, "category": "UNRELIABLE", "bias": "EXTREME_RIGHT"},
-            "breitbart.com": {"score": 0.40, "category": "QUESTIONABLE", "bias": "EXTREME_RIGHT"},
-            
-            # Fact-checking sites
-            "snopes.com": {"score": 0.95, "category": "FACT_CHECKER", "bias": "SLIGHT_LEFT"},
-            "factcheck.org": {"score": 0.95, "category": "FACT_CHECKER", "bias": "SLIGHT_LEFT"},
-            "politifact.com": {"score": 0.93, "category": "FACT_CHECKER", "bias": "SLIGHT_LEFT"},
-        }
+        found = {}
+        node = self._domain_trie
+        for label in reversed(domain.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            data = node.get('__data__')
+            if data:
+                found.update(data)
+        return found
+    
+    def _has_subdomain_entries(self, domain: str) -> bool:
+        """Check if the trie holds entries for any subdomain of domain"""
+        node = self._domain_trie
+        for label in reversed(domain.lower().split('.')):
+            node = node.get(label)
+            if node is None:
+                return False
+        return any(label != '__data__' for label in node)
+    
+    @staticmethod
+    def _minimal_fragments(entries: List[str]) -> Tuple[str, ...]:
+        """Drop entries that contain another entry, since the shorter one always matches first"""
+        return tuple(e for e in entries if not any(f != e and f in e for f in entries))
+    
+    @staticmethod
+    def _compile_pattern(pattern: str):
+        """Compile a pattern with RE2 when available, falling back to re"""
+        if HAVE_RE2:
+            try:
+                return re2.compile(pattern)
+            except Exception as e:
+                logger.warning(f"RE2 failed to compile pattern, falling back to re: {e}")
+        return re.compile(pattern)
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: List[str]):
+        """
+        Build an Aho-Corasick automaton over lowercased suspicious and explicit fake keywords
+        
+        Each word maps to (suspicious keyword or None, whether it is an explicit fake keyword)
+        """
+        entries = {keyword.lower(): (keyword, False) for keyword in keywords}
+        for keyword in EXPLICIT_FAKE_KEYWORDS:
+            entries[keyword] = (entries.get(keyword, (None,))[0], True)
         
-        return db
+        automaton = ahocorasick.Automaton()
+        for word, entry in entries.items():
+            automaton.add_word(word, entry)
+        automaton.make_automaton()
+        return automaton
+    
+    def _scan_keywords(self, text: str) -> Tuple[Optional[str], bool]:
+        """
+        Scan lowercased text for suspicious and explicit fake keywords
+        
+        Returns:
+            Tuple of (a suspicious keyword found or None, whether an explicit fake keyword was found)
+        """
+        if self._keyword_ac is None:
+            keyword = next((k for k in self.suspicious_keywords if k.lower() in text), None)
+            return keyword, any(k in text for k in EXPLICIT_FAKE_KEYWORDS)
+        
+        keyword = None
+        explicit_fake = False
+        for _, (suspicious, explicit) in self._keyword_ac.iter(text):
+            keyword = keyword or suspicious
+            explicit_fake = explicit_fake or explicit
+            if keyword and explicit_fake:
+                break
+        return keyword, explicit_fake
+    
+    def _load_credibility_database(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the credibility database from CREDIBILITY_DB_PATH
+        
+        Returns:
+            Dictionary with domain credibility information, empty if the file can't be read
+        """
+        try:
+            with open(CREDIBILITY_DB_PATH, 'rb') as f:
+                data = f.read()
+            db = orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+            logger.info(f"Loaded {len(db)} sources from credibility database {CREDIBILITY_DB_PATH}")
+            return db
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load credibility database {CREDIBILITY_DB_PATH}: {e}")
+            return {}
     
     def analyze_source(self, url: str) -> Dict[str, Any]:
         """
@@ -207,22 +531,27 @@ class SourceCredibilityAnalyzer:
             if not domain:
                 return self._create_unknown_result(url, "Invalid URL")
             
-            # Check if domain is in known fake news list
-            for fake_domain in self.fake_news_domains:
-                if fake_domain in domain.lower():
-                    logger.warning(f"Source domain {domain} matches known fake news pattern: {fake_domain}")
-                    return self._create_unknown_result(url, "Matches known fake news pattern")
+            base_domain = self._get_base_domain(domain)
+            known = self._lookup_domain(domain)
+            
+            # Check if domain is in known fake news list, by the domain trie
+            # first and then by the fragments it may contain
+            fake_domain = base_domain if "fake_news_domains" in known else next(
+                (fragment for fragment in self._fake_substrings if fragment in domain), None)
+            if fake_domain:
+                logger.warning(f"Source domain {domain} matches known fake news pattern: {fake_domain}")
+                return self._create_unknown_result(url, "Matches known fake news pattern", domain, base_domain)
             
             # Check if domain is in known credible list
-            for credible_domain in self.credible_domains:
-                if credible_domain in domain.lower():
-                    logger.info(f"Source domain {domain} matches known credible source: {credible_domain}")
-                    return self._create_unknown_result(url, "Matches known credible source")
+            credible_domain = base_domain if "credible_domains" in known else next(
+                (fragment for fragment in self._credible_substrings if fragment in domain), None)
+            if credible_domain:
+                logger.info(f"Source domain {domain} matches known credible source: {credible_domain}")
+                return self._create_unknown_result(url, "Matches known credible source", domain, base_domain)
             
             # Check if domain is in our database
-            base_domain = self._get_base_domain(domain)
-            if base_domain in self.credibility_db:
-                db_entry = self.credibility_db[base_domain].copy()
+            if "credibility_db" in known:
+                db_entry = known["credibility_db"]
                 
                 result = {
                     "url": url,
@@ -232,22 +561,29 @@ class SourceCredibilityAnalyzer:
                     "category": db_entry["category"],
                     "bias": db_entry.get("bias", "UNKNOWN"),
                     "source": "database",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now()
                 }
                 
                 logger.info(f"Source found in database: {base_domain} - Score: {db_entry['score']}")
                 return result
             
             # If not in database, check if it's in our cache
-            if domain in self.domain_cache:
+            with self._cache_lock:
+                cached = self.domain_cache.get(domain)
+                if cached is not None:
+                    self.domain_cache.move_to_end(domain)
+            if cached is not None:
                 logger.info(f"Source found in cache: {domain}")
-                return self.domain_cache[domain]
+                return cached
             
             # Need to analyze the domain
             domain_info = self._analyze_domain(domain, url)
             
             # Store in cache
-            self.domain_cache[domain] = domain_info
+            with self._cache_lock:
+                self.domain_cache[domain] = domain_info
+                if len(self.domain_cache) > DOMAIN_CACHE_SIZE:
+                    self.domain_cache.popitem(last=False)
             
             return domain_info
             
@@ -255,11 +591,27 @@ class SourceCredibilityAnalyzer:
             logger.error(f"Error analyzing source {url}: {str(e)}")
             return self._create_unknown_result(url, str(e))
     
+    def analyze_sources(self, urls: List[str], max_workers: int = 16) -> List[Dict[str, Any]]:
+        """
+        Analyze the credibility of several sources, fetching unknown domains concurrently
+        
+        Args:
+            urls: URLs of the sources
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            List of credibility results, in the same order as urls
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.analyze_source, urls))
+    
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
         try:
             # Handle URLs without scheme
-            if not url.startswith('http'):
+            if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
                 
             parsed_url = urlparse(url)
@@ -274,49 +626,50 @@ class SourceCredibilityAnalyzer:
             return ""
     
     def _get_base_domain(self, domain: str) -> str:
-        """Get base domain (e.g., nytimes.com from subdomain.nytimes.com)"""
-        parts = domain.split('.')
-        
-        # Handle common domain patterns
-        if len(parts) > 2:
-            # Check for country-specific domains like co.uk
-            if parts[-2] in ['co', 'com', 'org', 'net', 'gov', 'edu'] and parts[-1] in ['uk', 'au', 'nz', 'jp']:
-                if len(parts) > 3:
-                    return '.'.join(parts[-3:])
-                return domain
-            else:
-                return '.'.join(parts[-2:])
-        
-        return domain
+        """Get base domain (e.g., nytimes.com from subdomain.nytimes.com, bbc.co.uk from news.bbc.co.uk)"""
+        return self._registered_domain(self._extract(domain)) or domain
     
-    def _create_unknown_result(self, url: str, reason: str = "") -> Dict[str, Any]:
-        """Create result for unknown sources"""
-        domain = self._extract_domain(url) or "unknown"
+    @staticmethod
+    def _registered_domain(extracted: tldextract.ExtractResult) -> str:
+        """Domain plus public suffix of a parsed host, or an empty string if it has no public suffix"""
+        if extracted.domain and extracted.suffix:
+            return f"{extracted.domain}.{extracted.suffix}"
+        return ""
+    
+    def _create_unknown_result(self, url: str, reason: str = "", domain: Optional[str] = None,
+                               base_domain: Optional[str] = None) -> Dict[str, Any]:
+        """Create result for unknown sources, reusing the domain and base domain when already known"""
+        if domain is None:
+            domain = self._extract_domain(url) or "unknown"
+        if base_domain is None:
+            base_domain = self._get_base_domain(domain)
         
         result = {
             "url": url,
             "domain": domain,
-            "base_domain": self._get_base_domain(domain),
+            "base_domain": base_domain,
             "credibility_score": 0.5,  # Neutral score for unknown sources
             "category": "UNKNOWN",
             "bias": "UNKNOWN",
             "source": "analysis",
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now()
         }
         
         return result
     
-    def _respect_rate_limit(self) -> None:
-        """Respect rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _respect_rate_limit(self, host: str) -> None:
+        """Respect rate limiting between requests to the same host"""
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last = current_time - self.last_request_times.get(host, float('-inf'))
+            sleep_time = max(0.0, self.min_request_interval - time_since_last)
+            # Reserve this host's slot so concurrent callers queue behind it,
+            # then sleep outside the lock so other hosts are not held up
+            self.last_request_times[host] = current_time + sleep_time
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
+        if sleep_time > 0:
             time.sleep(sleep_time)
-            
-        self.last_request_time = time.time()
     
     def _analyze_domain(self, domain: str, url: str) -> Dict[str, Any]:
         """
@@ -330,9 +683,6 @@ class SourceCredibilityAnalyzer:
             Dictionary with credibility analysis
         """
         try:
-            # Respect rate limiting
-            self._respect_rate_limit()
-            
             # In a real implementation, this would:
             # 1. Check domain age and registration info (WHOIS)
             # 2. Look for about page, contact info, transparency policy
@@ -350,24 +700,29 @@ class SourceCredibilityAnalyzer:
             # Try to fetch and analyze homepage
             try:
                 # Respect rate limiting
-                self._respect_rate_limit()
+                self._respect_rate_limit(domain)
                 
-                response = requests.get(f"https://{domain}", 
-                                      headers=self.headers, 
-                                      timeout=10, 
-                                      allow_redirects=True)
+                response = self.session.get(f"https://{domain}", 
+                                            timeout=10, 
+                                            allow_redirects=True)
                 
-                self.last_request_time = time.time()
+                with self._rate_limit_lock:
+                    # Never move back a slot another caller already reserved
+                    self.last_request_times[domain] = max(
+                        self.last_request_times.get(domain, float('-inf')), time.monotonic()
+                    )
                 
                 if response.status_code == 200:
+                    page_text = response.text.lower()
+                    
                     # Check for contact info
-                    has_contact_info = 'contact' in response.text.lower()
+                    has_contact_info = 'contact' in page_text
                     
                     # Check for about page
-                    has_about_page = 'about' in response.text.lower()
+                    has_about_page = 'about' in page_text
                     
                     # Check for privacy policy
-                    has_privacy_policy = 'privacy' in response.text.lower()
+                    has_privacy_policy = 'privacy' in page_text
                     
                     # Update scores based on findings
                     base_score = 0.5  # Start with neutral score
@@ -406,7 +761,7 @@ class SourceCredibilityAnalyzer:
                             "privacy_policy": has_privacy_policy
                         },
                         "source": "analysis",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": _now()
                     }
                 
             except requests.exceptions.RequestException:
@@ -424,12 +779,42 @@ class SourceCredibilityAnalyzer:
                 "features": {
                     "https": uses_https
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now()
             }
             
         except Exception as e:
             logger.error(f"Error during domain analysis: {str(e)}")
-            return self._create_unknown_result(url, str(e))
+            return self._create_unknown_result(url, str(e), domain)
+    
+    def score_urls(self, urls: List[str]) -> np.ndarray:
+        """
+        Get credibility scores for many URLs at once
+        
+        Known sources are resolved with one vectorized lookup of their base
+        domains; only the remaining URLs go through get_credibility_score.
+        
+        Args:
+            urls: URLs to score
+            
+        Returns:
+            Array of scores in the same order as urls, NaN where a URL is empty
+        """
+        if HAVE_PANDAS:
+            series = pd.Series(urls, dtype=object)
+            bases = series.map(lambda url: self._registered_domain(self._extract(url)) if url else None)
+            scores = bases.map(self._score_table).to_numpy(dtype=float, copy=True)
+        else:
+            scores = np.array([
+                self._score_table.get(self._registered_domain(self._extract(url)), np.nan) if url else np.nan
+                for url in urls
+            ], dtype=float)
+        
+        # Fall back to the full analysis for URLs not in the table
+        for i in np.flatnonzero(np.isnan(scores)):
+            score = self.get_credibility_score(urls[i])
+            if score is not None:
+                scores[i] = score
+        return scores
     
     def get_credibility_score(self, url: str) -> Optional[float]:
         """
@@ -444,129 +829,149 @@ class SourceCredibilityAnalyzer:
         """
         if not url:
             return None
+        
+        with self._cache_lock:
+            score = self.score_cache.get(url)
+            if score is not None:
+                self.score_cache.move_to_end(url)
+        if score is not None:
+            return score
+        
+        score, cacheable = self._score_url(url)
+        
+        # Transient outcomes (failed fetches, errors) are recomputed on the next call
+        if cacheable:
+            with self._cache_lock:
+                self.score_cache[url] = score
+                if len(self.score_cache) > SCORE_CACHE_SIZE:
+                    self.score_cache.popitem(last=False)
+        return score
+    
+    def _score_url(self, url: str) -> Tuple[float, bool]:
+        """
+        Compute the credibility score for a non-empty URL, see get_credibility_score
+        
+        Args:
+            url: The URL to analyze
             
+        Returns:
+            Tuple of (score, cacheable), where cacheable is False when the score
+            depends on a failed page fetch or an analysis error
+        """
         try:
             # Extract domain from URL
-            extracted = tldextract.extract(url)
+            extracted = self._extract(url)
             domain = f"{extracted.domain}.{extracted.suffix}"
             
             # Log the domain being analyzed
             logger.debug(f"Analyzing source credibility for domain: {domain}")
             
+            # Known sources match the host or any parent domain (e.g. abcnews.go.com)
+            host = f"{extracted.subdomain}.{domain}" if extracted.subdomain else domain
+            known = self._lookup_domain(host.lower())
+            
             # If in known credible sources, return that score
-            if domain in self.credible_sources:
-                logger.debug(f"Domain {domain} found in credible sources database with score {self.credible_sources[domain]}")
-                return self.credible_sources[domain]
+            if "credible_sources" in known:
+                logger.debug(f"Domain {domain} found in credible sources database with score {known['credible_sources']}")
+                return known["credible_sources"], True
             
             # If in known non-credible sources, return that score
-            if domain in self.non_credible_sources:
-                logger.debug(f"Domain {domain} found in non-credible sources database with score {self.non_credible_sources[domain]}")
-                return self.non_credible_sources[domain]
-            
-            # If not in database, analyze the domain
-            score = 0.5  # Start with neutral score
-            
-            # Check for suspicious keywords in domain
-            for keyword in self.suspicious_keywords:
-                if keyword.lower() in domain.lower():
-                    score -= 0.1
-                    logger.debug(f"Suspicious keyword found in domain: {keyword}")
-                    break  # Only penalize once for keywords
-            
-            # Check for suspicious TLDs
-            for tld in self.suspicious_tlds:
-                if domain.lower().endswith(tld):
-                    score -= 0.1
-                    logger.debug(f"Suspicious TLD found: {tld}")
-                    break  # Only penalize once for TLD
-            
-            # Check for patterns that indicate fake news domains
-            for pattern in self.fake_domain_patterns:
-                if re.search(pattern, domain.lower()):
-                    score -= 0.2
-                    logger.debug(f"Domain matches fake news pattern: {pattern}")
-                    break  # Only penalize once for patterns
+            if "non_credible_sources" in known:
+                logger.debug(f"Domain {domain} found in non-credible sources database with score {known['non_credible_sources']}")
+                return known["non_credible_sources"], True
+            
+            # If not in database, extract features of the domain and combine them
+            features = [0] * NUM_FEATURES
+            
+            domain_lc = domain.lower()
+            
+            # Check for suspicious keywords in domain (only penalize once)
+            keyword, explicit_fake = self._scan_keywords(domain_lc)
+            if keyword:
+                features[F_KEYWORD] = 1
+                logger.debug(f"Suspicious keyword found in domain: {keyword}")
+            
+            # Check for suspicious TLDs (only penalize once)
+            if domain_lc.endswith(self._suspicious_tld_tuple):
+                features[F_TLD] = 1
+                logger.debug(f"Suspicious TLD found: {domain_lc[domain_lc.rfind('.'):]}")
+            
+            # Check for patterns that indicate fake news domains (only penalize once)
+            match = self._fake_domain_union.search(domain_lc)
+            if match:
+                features[F_FAKE_PATTERN] = 1
+                logger.debug(f"Domain matches fake news pattern: {self.fake_domain_patterns[int(match.lastgroup[1:])]}")
             
             # If subdomain contains suspicious words (like "truth.example.com")
             if extracted.subdomain:
-                for keyword in self.suspicious_keywords:
-                    if keyword.lower() in extracted.subdomain.lower():
-                        score -= 0.05
-                        logger.debug(f"Suspicious keyword found in subdomain: {keyword}")
-                        break
+                keyword, _ = self._scan_keywords(extracted.subdomain.lower())
+                if keyword:
+                    features[F_SUBDOMAIN_KEYWORD] = 1
+                    logger.debug(f"Suspicious keyword found in subdomain: {keyword}")
             
             # Apply additional checks for obviously fake domains
-            if "fake" in domain.lower() or "hoax" in domain.lower():
-                score = 0.1  # Very low credibility
+            if explicit_fake:
+                features[F_EXPLICIT_FAKE] = 1  # Very low credibility
                 logger.debug("Domain explicitly contains 'fake' or 'hoax'")
             
             # Check if the domain is brand new (may not be feasible in all environments)
             # This would require additional API calls to WHOIS services
             
             # Try to fetch site content for further analysis if score is ambiguous
-            if 0.3 <= score <= 0.7:
+            if 0.3 <= _combine_score(features) <= 0.7:
                 try:
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-                    response = requests.get(url, headers=headers, timeout=5)
+                    response = self.session.get(url, timeout=5)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                        soup = BeautifulSoup(response.content, HTML_PARSER)
+                        about_links, contact_links, iframes, ad_divs, sensational_count = _scan_dom(soup)
                         
                         # Check for "About Us" transparency
-                        about_links = soup.find_all('a', text=re.compile(r'about', re.I))
                         if not about_links:
-                            score -= 0.05
+                            features[F_NO_ABOUT] = 1
                             logger.debug("No 'About Us' link found")
                         
                         # Check for contact information
-                        contact_links = soup.find_all('a', text=re.compile(r'contact', re.I))
                         if not contact_links:
-                            score -= 0.05
+                            features[F_NO_CONTACT] = 1
                             logger.debug("No contact information found")
                         
                         # Check for excessive ads (simplified check)
-                        iframes = soup.find_all('iframe')
-                        ad_divs = soup.find_all('div', {'class': re.compile(r'ad|advertisement', re.I)})
-                        if len(iframes) + len(ad_divs) > 10:
-                            score -= 0.1
+                        if iframes + ad_divs > 10:
+                            features[F_MANY_ADS] = 1
                             logger.debug("Excessive number of ads detected")
                         
                         # Check for sensational headlines
-                        headlines = soup.find_all(['h1', 'h2', 'h3'])
-                        sensational_count = 0
-                        for headline in headlines:
-                            text = headline.get_text().lower()
-                            if any(phrase in text for phrase in ['shocking', 'you won\'t believe', 'incredible', 
-                                                              'mind-blowing', 'secret', 'they don\'t want you to know']):
-                                sensational_count += 1
-                        
+                        features[F_SENSATIONAL] = sensational_count
                         if sensational_count > 2:
-                            score -= 0.15
                             logger.debug(f"Multiple sensational headlines detected: {sensational_count}")
                 except Exception as e:
                     logger.warning(f"Error fetching website content for credibility analysis: {str(e)}")
                     # Slightly penalize for inaccessible content
-                    score -= 0.05
+                    features[F_FETCH_FAILED] = 1
             
-            # Ensure score stays within bounds
-            score = max(0.1, min(0.7, score))  # Unknown sources can't score higher than 0.7
+            # Unknown sources can't score higher than 0.7
+            score = _combine_score(features)
             logger.info(f"Final credibility score for {domain}: {score}")
-            return score
+            return score, not features[F_FETCH_FAILED]
             
         except Exception as e:
             logger.error(f"Error in source credibility analysis: {str(e)}")
-            return 0.5  # Return neutral score on error
+            return 0.5, False  # Return neutral score on error
     
     def check_for_hoax_patterns(self, text):
         """Check if the text contains common hoax patterns"""
         results = {}
-        for category, patterns in self.hoax_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    if category not in results:
-                        results[category] = []
-                    results[category].append(pattern)
+        for category, union in self._hoax_union.items():
+            found = {int(m.lastgroup[1:]) for m in union.finditer(text)}
+            if not found:
+                continue
+            # Matches of the union don't overlap, so a pattern whose match was
+            # swallowed by another one's is checked on its own
+            patterns = self._hoax_patterns_compiled[category]
+            results[category] = [
+                pattern.pattern for i, pattern in enumerate(patterns)
+                if i in found or pattern.search(text)
+            ]
         
         if results:
             logger.warning(f"Found hoax patterns in text: {results}")
@@ -575,22 +980,12 @@ class SourceCredibilityAnalyzer:
             
     def get_domain_type(self, url):
         """Categorize the domain type based on TLD and other factors"""
-        extracted = tldextract.extract(url)
+        extracted = self._extract(url)
         tld = f".{extracted.suffix}"
         
-        if tld in ['.gov', '.edu', '.mil']:
-            return "official", 0.9
-        elif tld == '.org':
-            # Check if it's a known fact-checking organization
-            if extracted.domain in ['snopes', 'factcheck', 'politifact']:
-                return "fact_checker", 0.9
-            return "organization", 0.7
-        elif tld in ['.com', '.net']:
-            # Check if it's a major news organization
-            if extracted.domain in ['cnn', 'bbc', 'nytimes', 'washingtonpost', 'reuters', 'ap']:
-                return "mainstream_news", 0.85
-            return "commercial", 0.5
-        elif tld in self.suspicious_tlds:
-            return "suspicious", 0.3
-        else:
-            return "other", 0.5 
\ No newline at end of file
+        # Known fact-checking or major news organization under this TLD
+        notable = self._notable_domains_by_tld.get(tld)
+        if notable and extracted.domain in notable[0]:
+            return notable[1]
+        
+        return self._domain_type_by_tld.get(tld, ("other", 0.5)) 
\ No newline at end of file
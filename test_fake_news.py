@@ -11,154 +11,403 @@ import sys
 import os
 import requests
 import json
+import time
+import asyncio
+import importlib.util
+from types import MappingProxyType
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
+# Try importing ijson for incremental parsing of streamed responses
+try:
+    import ijson
+    HAVE_IJSON = True
+except ImportError:
+    HAVE_IJSON = False
+
+# Try importing orjson for faster request encoding and response decoding
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Try importing httpx for concurrent async dispatch of test cases
+try:
+    import httpx
+    HAVE_HTTPX = True
+    # HTTP/2 support needs the optional h2 package
+    HAVE_HTTP2 = importlib.util.find_spec("h2") is not None
+except ImportError:
+    HAVE_HTTPX = False
+    HAVE_HTTP2 = False
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Set up logging
-logger.add("logs/tests.log", rotation="500 MB", level="INFO")
+# (connect, read) timeouts for calls to the API
+REQUEST_TIMEOUT = (3, 30)
+
+# Shared HTTP session so every call to the API reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Upper bound on concurrently dispatched test cases
+MAX_WORKERS = 8
+
+# Base URL of the API under test; point it at an https deployment to use HTTP/2
+API_URL = os.environ.get("FAKE_NEWS_API_URL", "http://localhost:8000").rstrip("/")
+
+# Detection endpoints
+DETECT_ENDPOINT = f"{API_URL}/detect"
+BATCH_ENDPOINT = f"{API_URL}/detect/batch"
+
+# httpx only negotiates HTTP/2 over TLS, so the async client is used for https deployments only
+USE_HTTP2 = HAVE_HTTPX and HAVE_HTTP2 and DETECT_ENDPOINT.startswith("https://")
+
+# Fields of a detection response that the tests inspect
+DETECTION_FIELDS = frozenset({"verdict", "confidence", "explanation"})
+
+# API verdicts that count as a match for each expected verdict
+MATCHING_VERDICTS = {
+    "FAKE": frozenset({"FAKE", "LIKELY FAKE", "FALSE"}),
+    "REAL": frozenset({"REAL", "TRUE", "LIKELY REAL", "LIKELY TRUE"}),
+}
+
+# Substrings that still count as a match for verdicts not listed above
+VERDICT_TOKENS = {
+    "FAKE": ("FAKE",),
+    "REAL": ("REAL", "TRUE"),
+}
+
+# Fake news detection test cases
+FAKE_NEWS_CASES = (
+    MappingProxyType({
+        "name": "Planetary Alignment Blackout Hoax",
+        "request": MappingProxyType({
+            "text": "NASA confirms that a planetary alignment of Venus and Jupiter in November will cause a nationwide blackout. The rare alignment will cause a gravitational effect on the sun, resulting in solar flares that will disrupt electrical grids across the world. NASA scientists are warning people to prepare for up to 15 days without electricity.",
+            "title": "NASA Warns of November Blackout Due to Planetary Alignment",
+            "source_url": "fakenewsmedia.net/nasa-blackout-warning"
+        }),
+        "expected_verdict": "FAKE"
+    }),
+    MappingProxyType({
+        "name": "Factual Science News",
+        "request": MappingProxyType({
+            "text": "A new study published in the journal Nature reveals that climate change is accelerating faster than previously thought. The research, conducted by scientists across 10 countries, compiled data from satellite observations and ground measurements over the past 50 years. The findings suggest that current models may have underestimated the rate of warming by approximately 0.1°C per decade.",
+            "title": "New Research Shows Climate Change Accelerating Faster Than Expected",
+            "source_url": "nature.com/articles/climate-research-2025"
+        }),
+        "expected_verdict": "REAL"
+    }),
+    MappingProxyType({
+        "name": "Health Conspiracy",
+        "request": MappingProxyType({
+            "text": "BREAKING: Whistleblower from major pharmaceutical company reveals secret cure for all cancers has been suppressed for decades. The miracle cure, based on a natural compound found in a rare Amazonian plant, has been 100% effective in clinical trials but is being hidden from the public to protect billion-dollar cancer treatment industry profits.",
+            "title": "EXPOSED: Secret Cancer Cure THEY Don't Want You to Know About",
+            "source_url": "healthtruthrevealed.info/cancer-cure-conspiracy"
+        }),
+        "expected_verdict": "FAKE"
+    })
+)
+
+# Source credibility test cases
+SOURCE_URL_CASES = (
+    MappingProxyType({"url": "https://www.reuters.com/article/example", "expected_range": (0.8, 1.0)}),
+    MappingProxyType({"url": "https://www.fakenewsmedia.net/article", "expected_range": (0.0, 0.3)}),
+    MappingProxyType({"url": "https://www.planetalignment-truth.com/blackout", "expected_range": (0.0, 0.3)}),
+    MappingProxyType({"url": "https://www.cnn.com/article", "expected_range": (0.7, 0.9)})
+)
+
+# Astronomical hoax test cases
+HOAX_TEXT_CASES = (
+    MappingProxyType({
+        "text": "NASA confirms that Venus and Jupiter will align in November, causing massive power outages across the world. The gravitational pull will affect the sun and cause solar flares.",
+        "expected": True
+    }),
+    MappingProxyType({
+        "text": "Scientists are studying the upcoming conjunction of Venus and Jupiter, which will be visible in the night sky. This is a regular astronomical event with no effect on Earth's power grid.",
+        "expected": False
+    }),
+    MappingProxyType({
+        "text": "The planetary alignment next month will create a massive energy disruption leading to blackouts worldwide. Governments are hiding this information from the public.",
+        "expected": True
+    })
+)
+
+# Set up the test log file; called from the script entry point, not at import
+def _setup_logging():
+    Path("logs").mkdir(exist_ok=True)
+    logger.add(
+        "logs/tests.log",
+        rotation="500 MB",
+        level="INFO",
+        enqueue=True,
+        serialize=False,
+        backtrace=False,
+        diagnose=False
+    )
 
 # Test if the API is running
 def test_api_connection():
     try:
-        response = requests.get("http://localhost:8000/")
+        response = SESSION.get(f"{API_URL}/", timeout=5)
         if response.status_code == 200:
             logger.info("API connection successful.")
             return True
         else:
-            logger.error(f"API connection failed. Status code: {response.status_code}")
+            logger.error("API connection failed. Status code: {}", response.status_code)
             return False
     except Exception as e:
-        logger.error(f"API connection failed with error: {str(e)}")
+        logger.error("API connection failed with error: {}", e)
         return False
 
-# Test the fake news detection endpoint with different test cases
-def test_fake_news_detection():
-    endpoint = "http://localhost:8000/detect"
-    
-    # Test cases
-    test_cases = [
-        {
-            "name": "Planetary Alignment Blackout Hoax",
-            "request": {
-                "text": "NASA confirms that a planetary alignment of Venus and Jupiter in November will cause a nationwide blackout. The rare alignment will cause a gravitational effect on the sun, resulting in solar flares that will disrupt electrical grids across the world. NASA scientists are warning people to prepare for up to 15 days without electricity.",
-                "title": "NASA Warns of November Blackout Due to Planetary Alignment",
-                "source_url": "fakenewsmedia.net/nasa-blackout-warning"
-            },
-            "expected_verdict": "FAKE"
-        },
-        {
-            "name": "Factual Science News",
-            "request": {
-                "text": "A new study published in the journal Nature reveals that climate change is accelerating faster than previously thought. The research, conducted by scientists across 10 countries, compiled data from satellite observations and ground measurements over the past 50 years. The findings suggest that current models may have underestimated the rate of warming by approximately 0.1°C per decade.",
-                "title": "New Research Shows Climate Change Accelerating Faster Than Expected",
-                "source_url": "nature.com/articles/climate-research-2025"
-            },
-            "expected_verdict": "REAL"
-        },
-        {
-            "name": "Health Conspiracy",
-            "request": {
-                "text": "BREAKING: Whistleblower from major pharmaceutical company reveals secret cure for all cancers has been suppressed for decades. The miracle cure, based on a natural compound found in a rare Amazonian plant, has been 100% effective in clinical trials but is being hidden from the public to protect billion-dollar cancer treatment industry profits.",
-                "title": "EXPOSED: Secret Cancer Cure THEY Don't Want You to Know About",
-                "source_url": "healthtruthrevealed.info/cancer-cure-conspiracy"
-            },
-            "expected_verdict": "FAKE"
-        }
-    ]
+# Build the result entry for a test case that could not be evaluated
+def _error_result(test, error):
+    return {
+        "test": test["name"],
+        "status": "ERROR",
+        "error": error
+    }
+
+# Serialize a request payload to JSON bytes
+def _encode_json(payload):
+    return orjson.dumps(payload) if HAVE_ORJSON else json.dumps(payload).encode("utf-8")
+
+# Decode a JSON response body
+def _decode_json(response):
+    return orjson.loads(response.content) if HAVE_ORJSON else response.json()
+
+# Pretty-print results for the log, only called when the record is emitted
+def _dump_results(results):
+    if HAVE_ORJSON:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(results, indent=2)
+
+# Parse a streamed detection response, keeping only the fields the tests use
+def _parse_detection(response):
+    if not HAVE_IJSON:
+        return _decode_json(response)
     
-    results = []
+    response.raw.decode_content = True
+    result = {}
+    for key, value in ijson.kvitems(response.raw, "", use_float=True):
+        if key in DETECTION_FIELDS:
+            result[key] = value
+    return result
+
+# Parse a streamed batch response into its list of detection results
+def _parse_batch(response):
+    if not HAVE_IJSON:
+        return _decode_json(response)["results"]
     
-    for test in test_cases:
-        try:
-            logger.info(f"Testing case: {test['name']}")
-            
-            # Send request to API
-            response = requests.post(
-                endpoint,
-                json=test["request"],
-                headers={"Content-Type": "application/json"}
+    response.raw.decode_content = True
+    return [
+        {key: value for key, value in item.items() if key in DETECTION_FIELDS}
+        for item in ijson.items(response.raw, "results.item", use_float=True)
+    ]
+
+# Compare a detection response against the expected verdict of a test case
+def _evaluate_case(test, result):
+    try:
+        # Unpack the fields used below once
+        actual_verdict = result["verdict"]
+        confidence = result["confidence"]
+        explanation = result["explanation"]
+        name = test["name"]
+        expected_verdict = test["expected_verdict"]
+        
+        # Check if verdict matches expected
+        is_match = actual_verdict == expected_verdict
+        if not is_match:
+            # Treat "LIKELY_FAKE" and "LIKELY FAKE" alike
+            normalized = actual_verdict.upper().replace("_", " ").strip()
+            is_match = normalized in MATCHING_VERDICTS.get(expected_verdict, frozenset()) or any(
+                token in normalized for token in VERDICT_TOKENS.get(expected_verdict, ())
             )
+        
+        if is_match:
+            logger.info("Test passed: {} - Expected: {}, Got: {}", name, expected_verdict, actual_verdict)
+        else:
+            logger.error("Test failed: {} - Expected: {}, Got: {}", name, expected_verdict, actual_verdict)
+        
+        return {
+            "test": name,
+            "status": "PASS" if is_match else "FAIL",
+            "expected": expected_verdict,
+            "actual": actual_verdict,
+            "confidence": confidence,
+            "explanation": explanation
+        }
             
+    except Exception as e:
+        logger.error("Error testing {}: {}", test["name"], e)
+        return _error_result(test, str(e))
+
+# Run a single detection test case against the API
+def _run_case(session, endpoint, test):
+    try:
+        logger.info("Testing case: {}", test["name"])
+        
+        # Send request to API, streaming the body so parsing overlaps the download
+        with session.post(
+            endpoint,
+            data=_encode_json(dict(test["request"])),
+            timeout=REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
             if response.status_code != 200:
-                logger.error(f"Test failed with status code {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                results.append({
-                    "test": test["name"],
-                    "status": "ERROR",
-                    "error": f"API returned status code {response.status_code}"
-                })
-                continue
+                logger.error("Test failed with status code {}", response.status_code)
+                logger.error("Response: {}", response.text)
+                return _error_result(test, f"API returned status code {response.status_code}")
             
             # Parse response
-            result = response.json()
+            result = _parse_detection(response)
+        
+        return _evaluate_case(test, result)
             
-            # Check if verdict matches expected
-            actual_verdict = result["verdict"]
-            expected_verdict = test["expected_verdict"]
+    except Exception as e:
+        logger.error("Error testing {}: {}", test["name"], e)
+        return _error_result(test, str(e))
+
+# Run a single detection test case against the API with an async client
+async def _run_case_async(client, semaphore, test):
+    try:
+        logger.info("Testing case: {}", test["name"])
+        
+        async with semaphore:
+            response = await client.post(DETECT_ENDPOINT, content=_encode_json(dict(test["request"])))
+        
+        if response.status_code != 200:
+            logger.error("Test failed with status code {}", response.status_code)
+            logger.error("Response: {}", response.text)
+            return _error_result(test, f"API returned status code {response.status_code}")
+        
+        return _evaluate_case(test, _decode_json(response))
+        
+    except Exception as e:
+        logger.error("Error testing {}: {}", test["name"], e)
+        return _error_result(test, str(e))
+
+# Run all test cases concurrently over one async client
+async def _run_cases_async(test_cases):
+    """
+    Dispatch the test cases with httpx over one multiplexed HTTP/2 connection,
+    with at most MAX_WORKERS requests in flight.
+    
+    Args:
+        test_cases: Test cases to evaluate
+        
+    Returns:
+        List of result entries in the same order as test_cases
+    """
+    connect_timeout, read_timeout = REQUEST_TIMEOUT
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"Content-Type": "application/json"},
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+    ) as client:
+        return await asyncio.gather(*(_run_case_async(client, semaphore, test) for test in test_cases))
+
+# Prime the connection pool and the server's models before the timed cases
+def _warm_up(session):
+    start = time.perf_counter()
+    try:
+        response = session.post(
+            DETECT_ENDPOINT,
+            data=_encode_json({"text": "warmup", "title": "", "source_url": ""}),
+            timeout=REQUEST_TIMEOUT
+        )
+        logger.info("Warmup request returned {} in {:.3f}s", response.status_code, time.perf_counter() - start)
+    except Exception as e:
+        logger.warning("Warmup request failed after {:.3f}s: {}", time.perf_counter() - start, e)
+
+# Run all test cases in a single request to the batch endpoint
+def _run_batch(session, test_cases):
+    """
+    Send every test case to the batch endpoint in one round-trip.
+    
+    Args:
+        session: HTTP session to send the request with
+        test_cases: Test cases to evaluate
+        
+    Returns:
+        List of result entries, or None if the API has no batch endpoint
+    """
+    try:
+        logger.info("Testing {} cases via batch endpoint", len(test_cases))
+        
+        payload = {"items": [dict(test["request"]) for test in test_cases]}
+        with session.post(BATCH_ENDPOINT, data=_encode_json(payload), timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code == 404:
+                logger.info("Batch endpoint not available, falling back to per-case requests")
+                # Read the short error body so the connection goes back to the pool
+                _ = response.content
+                return None
             
-            is_match = actual_verdict == expected_verdict or (
-                expected_verdict == "FAKE" and "FAKE" in actual_verdict or
-                expected_verdict == "REAL" and ("REAL" in actual_verdict or "TRUE" in actual_verdict)
-            )
+            if response.status_code != 200:
+                logger.error("Batch request failed with status code {}", response.status_code)
+                logger.error("Response: {}", response.text)
+                error = f"API returned status code {response.status_code}"
+                return [_error_result(test, error) for test in test_cases]
             
-            if is_match:
-                logger.info(f"Test passed: {test['name']} - Expected: {expected_verdict}, Got: {actual_verdict}")
-                results.append({
-                    "test": test["name"],
-                    "status": "PASS",
-                    "expected": expected_verdict,
-                    "actual": actual_verdict,
-                    "confidence": result["confidence"],
-                    "explanation": result["explanation"]
-                })
-            else:
-                logger.error(f"Test failed: {test['name']} - Expected: {expected_verdict}, Got: {actual_verdict}")
-                results.append({
-                    "test": test["name"],
-                    "status": "FAIL",
-                    "expected": expected_verdict,
-                    "actual": actual_verdict,
-                    "confidence": result["confidence"],
-                    "explanation": result["explanation"]
-                })
-                
-        except Exception as e:
-            logger.error(f"Error testing {test['name']}: {str(e)}")
-            results.append({
-                "test": test["name"],
-                "status": "ERROR",
-                "error": str(e)
-            })
+            batch_results = _parse_batch(response)
+        
+        if len(batch_results) != len(test_cases):
+            raise ValueError(f"Batch returned {len(batch_results)} results for {len(test_cases)} cases")
+        
+        return [_evaluate_case(test, result) for test, result in zip(test_cases, batch_results)]
+        
+    except Exception as e:
+        logger.error("Error in batch detection request: {}", e)
+        return [_error_result(test, str(e)) for test in test_cases]
+
+# Test the fake news detection endpoint with different test cases
+def test_fake_news_detection():
+    test_cases = FAKE_NEWS_CASES
+    
+    # Pay cold-start costs up front so the cases run at steady state
+    _warm_up(SESSION)
+    
+    # Send all cases in one round-trip when the API supports batching
+    results = _run_batch(SESSION, test_cases)
+    
+    if results is None and USE_HTTP2:
+        results = asyncio.run(_run_cases_async(test_cases))
+    elif results is None:
+        # Independent cases are dispatched concurrently over the shared session
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(test_cases))) as executor:
+            results = list(executor.map(lambda test: _run_case(SESSION, DETECT_ENDPOINT, test), test_cases))
     
     # Summarize results
-    passed = sum(1 for r in results if r["status"] == "PASS")
-    failed = sum(1 for r in results if r["status"] == "FAIL")
-    errors = sum(1 for r in results if r["status"] == "ERROR")
+    counts = Counter(r["status"] for r in results)
+    passed, failed, errors = counts["PASS"], counts["FAIL"], counts["ERROR"]
     
-    logger.info(f"Test summary: {passed} passed, {failed} failed, {errors} errors")
-    logger.info(f"Detailed results: {json.dumps(results, indent=2)}")
+    logger.info("Test summary: {} passed, {} failed, {} errors", passed, failed, errors)
+    logger.opt(lazy=True).info("Detailed results: {}", lambda: _dump_results(results))
     
     return results
 
+# Shared analyzer instance for the component tests, built on first use
+@lru_cache(maxsize=1)
+def _analyzer():
+    from utils.source_credibility import SourceCredibilityAnalyzer
+    return SourceCredibilityAnalyzer()
+
 # Test the source credibility analyzer specifically
 def test_source_credibility():
     try:
-        from utils.source_credibility import SourceCredibilityAnalyzer
-        
-        analyzer = SourceCredibilityAnalyzer()
-        
-        test_urls = [
-            {"url": "https://www.reuters.com/article/example", "expected_range": (0.8, 1.0)},
-            {"url": "https://www.fakenewsmedia.net/article", "expected_range": (0.0, 0.3)},
-            {"url": "https://www.planetalignment-truth.com/blackout", "expected_range": (0.0, 0.3)},
-            {"url": "https://www.cnn.com/article", "expected_range": (0.7, 0.9)}
-        ]
-        
-        results = []
+        analyzer = _analyzer()
+        test_urls = SOURCE_URL_CASES
         
-        for test in test_urls:
+        def check_url(test):
             url = test["url"]
             expected_min, expected_max = test["expected_range"]
             
@@ -167,93 +416,80 @@ def test_source_credibility():
             is_in_range = expected_min <= score <= expected_max
             
             if is_in_range:
-                logger.info(f"Source credibility test passed for {url}: {score} (expected range: {expected_min}-{expected_max})")
-                results.append({
+                logger.info("Source credibility test passed for {}: {} (expected range: {}-{})", url, score, expected_min, expected_max)
+                return {
                     "url": url,
                     "status": "PASS",
                     "score": score,
                     "expected_range": test["expected_range"]
-                })
+                }
             else:
-                logger.error(f"Source credibility test failed for {url}: {score} (expected range: {expected_min}-{expected_max})")
-                results.append({
+                logger.error("Source credibility test failed for {}: {} (expected range: {}-{})", url, score, expected_min, expected_max)
+                return {
                     "url": url,
                     "status": "FAIL",
                     "score": score,
                     "expected_range": test["expected_range"]
-                })
+                }
         
-        logger.info(f"Source credibility test results: {json.dumps(results, indent=2)}")
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(test_urls))) as executor:
+            results = list(executor.map(check_url, test_urls))
+        
+        logger.opt(lazy=True).info("Source credibility test results: {}", lambda: _dump_results(results))
         return results
         
     except Exception as e:
-        logger.error(f"Error in source credibility test: {str(e)}")
+        logger.error("Error in source credibility test: {}", e)
         return None
 
 # Test astronomical hoax patterns specifically
 def test_astronomical_hoax_detection():
     try:
-        from utils.source_credibility import SourceCredibilityAnalyzer
-        
-        analyzer = SourceCredibilityAnalyzer()
-        
-        test_texts = [
-            {
-                "text": "NASA confirms that Venus and Jupiter will align in November, causing massive power outages across the world. The gravitational pull will affect the sun and cause solar flares.",
-                "expected": True
-            },
-            {
-                "text": "Scientists are studying the upcoming conjunction of Venus and Jupiter, which will be visible in the night sky. This is a regular astronomical event with no effect on Earth's power grid.",
-                "expected": False
-            },
-            {
-                "text": "The planetary alignment next month will create a massive energy disruption leading to blackouts worldwide. Governments are hiding this information from the public.",
-                "expected": True
-            }
-        ]
+        analyzer = _analyzer()
+        test_texts = HOAX_TEXT_CASES
         
-        results = []
-        
-        for test in test_texts:
+        def check_text(test):
             text = test["text"]
             expected = test["expected"]
             
             is_hoax, patterns = analyzer.check_for_hoax_patterns(text)
             
             if is_hoax == expected:
-                logger.info(f"Astronomical hoax test passed: {is_hoax} (expected: {expected})")
+                logger.info("Astronomical hoax test passed: {} (expected: {})", is_hoax, expected)
                 if is_hoax:
-                    logger.info(f"Detected patterns: {patterns}")
-                results.append({
+                    logger.info("Detected patterns: {}", patterns)
+                return {
                     "text": text[:50] + "...",
                     "status": "PASS",
                     "is_hoax": is_hoax,
                     "expected": expected,
                     "patterns": patterns if is_hoax else None
-                })
+                }
             else:
-                logger.error(f"Astronomical hoax test failed: {is_hoax} (expected: {expected})")
-                results.append({
+                logger.error("Astronomical hoax test failed: {} (expected: {})", is_hoax, expected)
+                return {
                     "text": text[:50] + "...",
                     "status": "FAIL",
                     "is_hoax": is_hoax,
                     "expected": expected,
                     "patterns": patterns if is_hoax else None
-                })
+                }
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(test_texts))) as executor:
+            results = list(executor.map(check_text, test_texts))
         
-        logger.info(f"Astronomical hoax detection test results: {json.dumps(results, indent=2)}")
+        logger.opt(lazy=True).info("Astronomical hoax detection test results: {}", lambda: _dump_results(results))
         return results
         
     except Exception as e:
-        logger.error(f"Error in astronomical hoax detection test: {str(e)}")
+        logger.error("Error in astronomical hoax detection test: {}", e)
         return None
 
 if __name__ == "__main__":
     print("Starting Fake News Detection System tests...")
     
-    # Create logs directory if it doesn't exist
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
+    # Set up logging
+    _setup_logging()
     
     # Run tests
     api_running = test_api_connection()
@@ -263,7 +499,7 @@ if __name__ == "__main__":
         fake_news_results = test_fake_news_detection()
         
         # Print summary of fake news detection results
-        passes = sum(1 for r in fake_news_results if r["status"] == "PASS")
+        passes = Counter(r["status"] for r in fake_news_results)["PASS"]
         total = len(fake_news_results)
         print(f"Fake news detection tests: {passes}/{total} passed")
     else:
@@ -274,14 +510,14 @@ if __name__ == "__main__":
     print("\nTesting source credibility analyzer...")
     credibility_results = test_source_credibility()
     if credibility_results:
-        passes = sum(1 for r in credibility_results if r["status"] == "PASS")
+        passes = Counter(r["status"] for r in credibility_results)["PASS"]
         total = len(credibility_results)
         print(f"Source credibility tests: {passes}/{total} passed")
     
     print("\nTesting astronomical hoax detection...")
     hoax_results = test_astronomical_hoax_detection()
     if hoax_results:
-        passes = sum(1 for r in hoax_results if r["status"] == "PASS")
+        passes = Counter(r["status"] for r in hoax_results)["PASS"]
         total = len(hoax_results)
         print(f"Astronomical hoax detection tests: {passes}/{total} passed")
     
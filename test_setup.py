@@ -6,22 +6,73 @@ Test script to verify that the Fake News Detection System is properly set up
 import os
 import sys
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
+# Packages whose import name differs from the name they are listed under
+MODULE_ALIASES = {
+    "opencv": "cv2",
+}
+
+# Dependencies required to run the system
+CORE_DEPS = (
+    "fastapi", "uvicorn", "pydantic", "numpy", "pandas", 
+    "nltk", "loguru", "dotenv", "requests"
+)
+
+# Optional dependencies that enable the advanced features
+ADVANCED_DEPS = (
+    "torch", "tensorflow", "transformers", "spacy", 
+    "googlesearch", "facenet_pytorch", "opencv"
+)
+
+# Files that make up the project structure
+REQUIRED_FILES = tuple(Path(p) for p in (
+    "run.py", "requirements.txt", "dotenv.env",
+    "app/main.py", "utils/sentiment_analyzer.py",
+    "services/news_verification.py", "models/model_manager.py"
+))
+
+# Directory the system writes its logs to
+LOGS_DIR = Path("logs")
+
+# Header printed at the start of the setup test
+BANNER = "\n=== Fake News Detection System Setup Test ===\n"
+
+@lru_cache(maxsize=None)
 def check_module(module_name):
-    """Check if a Python module is installed"""
+    """Check if a Python module is installed, without importing it"""
     try:
-        importlib.import_module(module_name)
-        return True
-    except ImportError:
+        return importlib.util.find_spec(MODULE_ALIASES.get(module_name, module_name)) is not None
+    except (ModuleNotFoundError, ValueError):
         return False
 
+def check_files(file_paths):
+    """Check which files exist, scanning each parent directory only once"""
+    listings = {}
+    present = {}
+    for file_path in file_paths:
+        parent, name = os.path.split(file_path)
+        parent = parent or "."
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                listings[parent] = set()
+            except OSError:
+                listings[parent] = None
+        
+        entries = listings[parent]
+        present[file_path] = name in entries if entries is not None else Path(file_path).exists()
+    return present
+
 def main():
     # Print header
-    print("\n=== Fake News Detection System Setup Test ===\n")
+    print(BANNER)
     
     # Check Python version
-    py_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    py_version = sys.version.partition(" ")[0]
     print(f"Python version: {py_version}")
     if sys.version_info < (3, 8):
         print("[FAIL] Python 3.8+ required")
@@ -30,13 +81,8 @@ def main():
     
     # Check core dependencies
     print("\nChecking core dependencies:")
-    core_deps = [
-        "fastapi", "uvicorn", "pydantic", "numpy", "pandas", 
-        "nltk", "loguru", "dotenv", "requests"
-    ]
-    
     all_core_present = True
-    for dep in core_deps:
+    for dep in CORE_DEPS:
         if check_module(dep):
             print(f"[PASS] {dep}")
         else:
@@ -45,13 +91,8 @@ def main():
     
     # Check advanced dependencies
     print("\nChecking advanced dependencies (optional):")
-    advanced_deps = [
-        "torch", "tensorflow", "transformers", "spacy", 
-        "googlesearch", "facenet_pytorch", "opencv"
-    ]
-    
     advanced_count = 0
-    for dep in advanced_deps:
+    for dep in ADVANCED_DEPS:
         if check_module(dep):
             print(f"[PASS] {dep}")
             advanced_count += 1
@@ -60,25 +101,19 @@ def main():
     
     # Check if files exist
     print("\nChecking project structure:")
-    required_files = [
-        "run.py", "requirements.txt", "dotenv.env",
-        "app/main.py", "utils/sentiment_analyzer.py",
-        "services/news_verification.py", "models/model_manager.py"
-    ]
-    
     all_files_present = True
-    for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"[PASS] {file_path}")
+    for file_path, exists in check_files(REQUIRED_FILES).items():
+        if exists:
+            print(f"[PASS] {file_path.as_posix()}")
         else:
-            print(f"[FAIL] {file_path} - missing")
+            print(f"[FAIL] {file_path.as_posix()} - missing")
             all_files_present = False
     
     # Check logs directory
-    if not Path("logs").exists():
-        os.makedirs("logs", exist_ok=True)
+    try:
+        LOGS_DIR.mkdir()
         print("[PASS] logs directory created")
-    else:
+    except FileExistsError:
         print("[PASS] logs directory exists")
     
     # Print summary
@@ -91,8 +126,8 @@ def main():
     
     if advanced_count == 0:
         print("[INFO] No advanced dependencies detected - system will run in safe mode only")
-    elif advanced_count < len(advanced_deps):
-        print(f"[INFO] Some advanced dependencies detected ({advanced_count}/{len(advanced_deps)}) - limited advanced features")
+    elif advanced_count < len(ADVANCED_DEPS):
+        print(f"[INFO] Some advanced dependencies detected ({advanced_count}/{len(ADVANCED_DEPS)}) - limited advanced features")
     else:
         print("[PASS] All advanced dependencies installed - full functionality available")
     